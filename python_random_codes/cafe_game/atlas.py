@@ -0,0 +1,74 @@
+# atlas.py
+# Готові поверхні для visuals.py: тіла клієнтів, іконки та кнопки інгредієнтів
+# малюються один раз, далі кадр складається лише з blit.
+from collections import OrderedDict
+
+import pygame
+from ingredients import INGREDIENTS
+from visuals import ICON_SIZE, draw_body, draw_button, draw_icon
+
+
+class TextCache:
+    """LRU-кеш поверхонь тексту за ключем (рядок, шрифт, колір)."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+
+    def render(self, font, text, color, antialias=True):
+        key = (text, font, color, antialias)
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+            return surf
+        surf = font.render(text, antialias, color)
+        self._cache[key] = surf
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return surf
+
+    def __len__(self):
+        return len(self._cache)
+
+
+class Atlas:
+    """
+    Кеш спрайтів. Створюється після pygame.init() (потрібні шрифти).
+    Іконки замовлень готуються одразу для всіх INGREDIENTS, тіла та кнопки — при першому запиті.
+    """
+
+    def __init__(self, font, text_maxsize=256):
+        self.font = font
+        self._text = TextCache(text_maxsize)
+        self._icons = {name: self._render_icon(name) for name in INGREDIENTS}
+        self._bodies = {}
+        self._buttons = {}
+
+    def text(self, font, text, color):
+        return self._text.render(font, text, color)
+
+    def icon(self, item):
+        return self._icons[item]
+
+    def body(self, color, size, radius, smile):
+        key = (color, size, radius, smile)
+        surf = self._bodies.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            draw_body(surf, 0, 0, color, size, radius, smile)
+            self._bodies[key] = surf
+        return surf
+
+    def button(self, name, selected, size):
+        key = (name, selected, size)
+        surf = self._buttons.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            draw_button(surf, pygame.Rect((0, 0), size), name, selected, self.font)
+            self._buttons[key] = surf
+        return surf
+
+    def _render_icon(self, item):
+        surf = pygame.Surface((ICON_SIZE, ICON_SIZE), pygame.SRCALPHA)
+        draw_icon(surf, 0, 0, item, self.font)
+        return surf
@@ -0,0 +1,102 @@
+# customer_store.py
+# Черга клієнтів у вигляді масивів (struct of arrays) замість словника на кожного клієнта.
+# Слот — індекс у масивах; звільнені слоти повторно використовуються через список вільних.
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # без NumPy таймери оновлюються циклом, результат той самий
+    np = None
+
+INF = float("inf")
+
+
+class CustomerStore:
+    """
+    Попередньо виділені масиви:
+      wait  — скільки мс лишилось чекати (INF — слот вільний),
+      spawn — час появи (мс від початку зміни),
+      look  — індекс зовнішнього вигляду,
+      order — id замовлення.
+    Коли місця не лишається, місткість подвоюється.
+    З NumPy tick() зменшує всі таймери й знаходить тих, хто пішов, двома векторними операціями.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        self.wait = self._new("d", 0)
+        self.spawn = self._new("d", 0)
+        self.look = self._new("i", 0)
+        self.order = self._new("i", 0)
+        self._free = []
+        self._count = 0
+        self._grow(capacity)
+
+    def __len__(self):
+        return self._count
+
+    @staticmethod
+    def _new(typecode, n, fill=0):
+        if np is not None:
+            return np.full(n, fill, dtype=np.float64 if typecode == "d" else np.int32)
+        return array(typecode, [fill]) * n
+
+    def _grow(self, capacity):
+        extra = capacity - self.capacity
+        if np is not None:
+            self.wait = np.concatenate([self.wait, self._new("d", extra, INF)])
+            self.spawn = np.concatenate([self.spawn, self._new("d", extra)])
+            self.look = np.concatenate([self.look, self._new("i", extra)])
+            self.order = np.concatenate([self.order, self._new("i", extra)])
+        else:
+            self.wait.extend(self._new("d", extra, INF))
+            self.spawn.extend(self._new("d", extra))
+            self.look.extend(self._new("i", extra))
+            self.order.extend(self._new("i", extra))
+        # вільні слоти беремо з кінця списку, тож молодші індекси — першими
+        self._free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def add(self, wait_ms, spawn_ms, look, order_id):
+        """Займає вільний слот і повертає його індекс."""
+        if not self._free:
+            self._grow(max(1, self.capacity * 2))
+        slot = self._free.pop()
+        self.wait[slot] = wait_ms
+        self.spawn[slot] = spawn_ms
+        self.look[slot] = look
+        self.order[slot] = order_id
+        self._count += 1
+        return slot
+
+    def remove(self, slot):
+        self.wait[slot] = INF
+        self._free.append(slot)
+        self._count -= 1
+
+    def clear(self):
+        self.wait[:] = self._new("d", self.capacity, INF)
+        self._free = list(range(self.capacity - 1, -1, -1))
+        self._count = 0
+
+    def tick(self, dt_ms):
+        """Зменшує всі таймери на dt_ms. Слоти, чий час вийшов, звільняються; повертає їх список."""
+        if not self._count:
+            return []
+        wait = self.wait
+        if np is not None:
+            wait -= dt_ms  # INF - dt лишається INF, тож вільні слоти не «спливають»
+            expired = np.flatnonzero(wait <= 0).tolist()
+        else:
+            expired = []
+            for slot, w in enumerate(wait):
+                if w != INF:
+                    w -= dt_ms
+                    wait[slot] = w
+                    if w <= 0:
+                        expired.append(slot)
+        for slot in expired:
+            wait[slot] = INF
+        self._free.extend(expired)
+        self._count -= len(expired)
+        return expired
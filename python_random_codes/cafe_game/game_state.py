@@ -0,0 +1,317 @@
+# game_state.py
+# Логіка гри без pygame: спавн клієнтів, таймери очікування, видача замовлень, рівні.
+# main.py лише передає сюди клік/час і малює стан; headless.py крокує її без вікна.
+import itertools
+import math
+import random
+from collections import deque
+
+from customer_store import CustomerStore
+from ingredients import INGREDIENTS, generate_order, order_key
+from input_log import CLEAR, NEXT_LEVEL, SERVE, SERVE_BEST, STEP, TOGGLE
+from level_data import LEVELS
+
+CUSTOMER_COLORS = [(150, 200, 255), (200, 180, 255), (180, 255, 200), (255, 200, 180)]
+CUSTOMER_SIZES = [(50, 70), (60, 80), (70, 90)]
+CUSTOMER_BORDERS = [4, 8, 12]
+# усі варіанти вигляду (разом з ротом); клієнт зберігає лише індекс у цьому списку
+APPEARANCES = [
+    {"color": color, "size": size, "border_radius": radius, "smile": smile}
+    for color, size, radius, smile in itertools.product(CUSTOMER_COLORS, CUSTOMER_SIZES, CUSTOMER_BORDERS,
+                                                        (False, True))
+]
+
+
+class GameState:
+    """
+    Стан однієї зміни. Час — у мілісекундах, його передає той, хто крокує гру
+    (clock.tick у main.py або симуляція в headless.py).
+    state: "game" — йде рівень, "next_level" — рівень пройдено, "end" — кінець зміни.
+    Клієнти живуть у CustomerStore; customers — їхні слоти в порядку появи,
+    дані клієнта читаються через order(), appearance(), wait_ms(), progress().
+    Черги зберігають номери клієнтів, а не слоти: обслужений чи пішов клієнт лише
+    зникає з _slot_of, і його номер у чергах пропускається («надгробок»), тож
+    видалення — O(1), а сміття з черг вичищається пачкою в _compact().
+
+    Випадковість — лише з потоків сесії: rng (замовлення, вигляд) і visual_rng (рот),
+    обидва виводяться з цілого seed, тож та сама зміна з тим самим насінням і діями повторюється точно.
+    Без seed він береться з log, інакше з переданого rng (одне число), інакше випадковий.
+    Якщо передано log (input_log.InputLog), кожна дія та крок часу дописуються в нього,
+    а журнал без насіння отримує насіння гри.
+    """
+
+    def __init__(self, levels=LEVELS, rng=None, seed=None, log=None):
+        if seed is None and log is not None:
+            seed = log.seed
+        if seed is None:
+            # журнал зберігає лише насіння, тож і потік з rng зводимо до нього — інакше повтор розійдеться
+            seed = (rng or random).randrange(2**63)
+        if log is not None and log.seed is None:
+            log.seed = seed
+        self.levels = levels
+        self.seed = seed
+        self.log = log
+        self.rng = random.Random(seed)
+        # окремий потік для суто візуальних рішень, щоб малювання не зсувало логіку
+        self.visual_rng = random.Random(f"{seed}/visuals")
+        self.available_items = list(INGREDIENTS.keys())
+        self.selected = []
+        self.store = CustomerStore()
+        self._queue = deque()  # номери клієнтів у порядку появи (з надгробками)
+        self.by_order = {}  # ключ замовлення -> deque номерів (першим — кому лишилось найменше чекати)
+        self._slot_of = {}  # номер живого клієнта -> слот
+        self._id_of = {}  # слот -> номер живого клієнта
+        self._next_id = 0
+        self._stale = 0
+        self.orders = []  # id замовлення -> кортеж інгредієнтів
+        self.order_keys = []  # id замовлення -> order_key
+        self._order_ids = {}
+        self.score = 0
+        self.served_count = 0
+        self.expired_count = 0
+        self.clock_ms = 0
+        self.level_index = 0
+        self.state = "game"
+        self._start_level()
+
+    # --- Рівні ---
+    @property
+    def level(self):
+        return self.levels[self.level_index]
+
+    def _start_level(self):
+        level = self.level
+        self.time_remaining = level["level_time"]
+        self.spawn_interval = level["spawn_interval"]
+        self.customer_wait_ms = level["customer_wait_ms"]
+        self.spawn_acc = 0.0
+        self.spawned_customers = 0
+        self.selected.clear()
+        self.store.clear()
+        self._queue = deque()
+        self.by_order = {}
+        self._slot_of = {}
+        self._id_of = {}
+        self._stale = 0
+        self._add_customer(self.make_customer())  # початковий клієнт
+        self.state = "game"
+
+    def _finish_level(self):
+        self.level_index += 1
+        self.selected.clear()
+        self.state = "next_level" if self.level_index < len(self.levels) else "end"
+
+    def next_level(self):
+        """Перехід з екрана «Рівень пройдено» до наступного рівня."""
+        if self.log is not None:
+            self.log.record(NEXT_LEVEL)
+        if self.state == "next_level":
+            self._start_level()
+
+    # --- Клієнти ---
+    def make_customer(self):
+        """Створює клієнта у сховищі й повертає його слот."""
+        rng = self.rng
+        order_id = self._order_id(generate_order(rng))
+        color = rng.randrange(len(CUSTOMER_COLORS))
+        size = rng.randrange(len(CUSTOMER_SIZES))
+        radius = rng.randrange(len(CUSTOMER_BORDERS))
+        smile = self.visual_rng.random() < 0.5
+        look = ((color * len(CUSTOMER_SIZES) + size) * len(CUSTOMER_BORDERS) + radius) * 2 + smile
+        return self.store.add(self.customer_wait_ms, self.clock_ms, look, order_id)
+
+    def _order_id(self, order):
+        order = tuple(order)
+        order_id = self._order_ids.get(order)
+        if order_id is None:
+            order_id = self._order_ids[order] = len(self.orders)
+            self.orders.append(order)
+            self.order_keys.append(order_key(order))
+        return order_id
+
+    def order(self, slot):
+        return self.orders[self.store.order[slot]]
+
+    def key(self, slot):
+        return self.order_keys[self.store.order[slot]]
+
+    def appearance(self, slot):
+        """Словник color/size/border_radius/smile для visuals.draw_customer."""
+        return APPEARANCES[self.store.look[slot]]
+
+    def wait_ms(self, slot):
+        return self.store.wait[slot]
+
+    def spawn_time(self, slot):
+        return self.store.spawn[slot]
+
+    @property
+    def customers(self):
+        """Слоти клієнтів у порядку появи — для малювання й кліків, O(n)."""
+        slot_of = self._slot_of
+        return [slot_of[cid] for cid in self._queue if cid in slot_of]
+
+    @property
+    def waiting(self):
+        """Скільки клієнтів зараз у черзі."""
+        return len(self._slot_of)
+
+    def first_customer(self):
+        """Слот найдавнішого клієнта (йому лишилось найменше чекати) або None."""
+        cid = self._first(self._queue)
+        return None if cid is None else self._slot_of[cid]
+
+    def _first(self, queue):
+        # надгробки на початку черги знімаємо тут же — кожен лише раз
+        slot_of = self._slot_of
+        while queue and queue[0] not in slot_of:
+            queue.popleft()
+        return queue[0] if queue else None
+
+    def _add_customer(self, slot):
+        # усі клієнти рівня чекають однаково довго, тож новий завжди має найбільший залишок — у кінець
+        cid = self._next_id
+        self._next_id += 1
+        self._slot_of[cid] = slot
+        self._id_of[slot] = cid
+        self._queue.append(cid)
+        key = self.key(slot)
+        queue = self.by_order.get(key)
+        if queue is None:
+            queue = self.by_order[key] = deque()
+        queue.append(cid)
+
+    def _drop(self, slot):
+        # O(1): номер клієнта лишається в чергах надгробком, доки його не знімуть _first чи _compact
+        del self._slot_of[self._id_of.pop(slot)]
+        self._stale += 1
+        if self._stale > len(self._slot_of) + 32:
+            self._compact()
+
+    def _compact(self):
+        # надгробків стало більше, ніж живих, — перебудова черг окупається за рахунок цих видалень
+        slot_of = self._slot_of
+        self._queue = deque(cid for cid in self._queue if cid in slot_of)
+        for key, queue in list(self.by_order.items()):
+            queue = deque(cid for cid in queue if cid in slot_of)
+            if queue:
+                self.by_order[key] = queue
+            else:
+                del self.by_order[key]
+        self._stale = 0
+
+    # --- Дії гравця ---
+    def toggle_ingredient(self, name):
+        if self.log is not None:
+            self.log.record(TOGGLE, self.available_items.index(name))
+        if name in self.selected:
+            self.selected.remove(name)
+        else:
+            self.selected.append(name)
+
+    def clear_selection(self):
+        if self.log is not None:
+            self.log.record(CLEAR)
+        self.selected.clear()
+
+    def serve(self, slot):
+        """Віддає вибрані інгредієнти клієнту зі слоту slot. Повертає True, якщо замовлення збіглося."""
+        if self.log is not None:
+            self.log.record(SERVE, slot)
+        if self.state != "game" or slot not in self._id_of:
+            return False
+        if order_key(self.selected) != self.key(slot):
+            return False
+        self._drop(slot)
+        self.store.remove(slot)
+        self._served()
+        return True
+
+    def matching_customers(self):
+        """Слоти клієнтів, яких можна обслужити поточним вибором (першим — найнетерплячіший). Порожньо, якщо нікого."""
+        slot_of = self._slot_of
+        return [slot_of[cid] for cid in self.by_order.get(order_key(self.selected), ()) if cid in slot_of]
+
+    def serve_best(self):
+        """Віддає вибране клієнту з таким самим замовленням, якому лишилось найменше чекати."""
+        if self.log is not None:
+            self.log.record(SERVE_BEST)
+        if self.state != "game":
+            return False
+        key = order_key(self.selected)
+        queue = self.by_order.get(key)
+        if queue is None:
+            return False
+        cid = self._first(queue)
+        if cid is None:
+            del self.by_order[key]
+            return False
+        slot = self._slot_of[cid]
+        self._drop(slot)
+        self.store.remove(slot)
+        self._served()
+        return True
+
+    def _served(self):
+        self.score += 10
+        self.served_count += 1
+        self.selected.clear()
+        self._check_level_done()
+
+    # --- Час ---
+    def step(self, dt_ms):
+        """
+        Просуває логіку на dt_ms мілісекунд (поза рівнем іде лише годинник).
+        Для запису в журнал dt_ms має бути цілим (як у clock.tick).
+        """
+        if self.log is not None:
+            self.log.record(STEP, dt_ms)
+        self.clock_ms += dt_ms
+        if self.state != "game":
+            return
+        dt = dt_ms / 1000.0
+        self.time_remaining -= dt
+        self.spawn_acc += dt
+
+        # спавн нових клієнтів
+        level = self.level
+        if self.spawn_acc >= self.spawn_interval and self.spawned_customers < level["total_customers"]:
+            self._add_customer(self.make_customer())
+            self.spawned_customers += 1
+            self.spawn_acc = 0.0
+
+        # оновлення таймерів очікування — одна операція над масивом сховища
+        expired = self.store.tick(dt_ms)
+        if expired:
+            for slot in expired:
+                self._drop(slot)
+            self.expired_count += len(expired)
+        self._check_level_done()
+
+    def _check_level_done(self):
+        # рівень пройдено, коли прийшли всі його клієнти і черга порожня
+        if self.spawned_customers == self.level["total_customers"] and not self._slot_of:
+            self._finish_level()
+
+    def time_to_next_event(self):
+        """
+        Скільки мілісекунд можна крокувати одним step(), не пропустивши спавн чи
+        відхід клієнта. Для швидкої симуляції без фіксованого кадру.
+        """
+        if self.state != "game":
+            return math.inf
+        best = math.inf
+        if self.spawned_customers < self.level["total_customers"]:
+            best = max(0.0, (self.spawn_interval - self.spawn_acc) * 1000.0)
+        first = self.first_customer()
+        if first is not None:
+            # найменше лишилось першому в черзі
+            best = min(best, self.store.wait[first])
+        return max(1, math.ceil(best)) if best != math.inf else best
+
+    def progress(self, slot, ahead_ms=0):
+        """
+        Частка часу очікування, що лишилась у клієнта (1.0 -> 0.0).
+        ahead_ms — наскільки заглянути вперед (інтерполяція між кроками фіксованого такту).
+        """
+        return max(0.0, (self.store.wait[slot] - ahead_ms) / self.customer_wait_ms)
@@ -0,0 +1,131 @@
+# headless.py
+# Симуляція змін без вікна: GameState крокується від події до події, а гравця замінює бот.
+# Запуск:  python headless.py --shifts 5000 --serve-ms 1500 --mistake-rate 0.1
+import argparse
+import math
+import random
+import time
+
+from game_state import GameState
+from input_log import InputLog
+from level_data import LEVELS
+
+
+class Bot:
+    """
+    Скриптований гравець: раз на serve_ms збирає замовлення найнетерплячішого клієнта
+    і віддає його через serve_best. З імовірністю mistake_rate забуває один інгредієнт (видача не вдається,
+    вибір скидається). Після рівня натискає «далі» через next_level_ms.
+    """
+
+    def __init__(self, serve_ms=1500, mistake_rate=0.0, next_level_ms=500, rng=None):
+        self.serve_ms = serve_ms
+        self.mistake_rate = mistake_rate
+        self.next_level_ms = next_level_ms
+        self.rng = rng or random.Random()
+        self.cooldown = serve_ms
+
+    def time_to_next_action(self, game):
+        if game.state == "game" and not game.waiting:
+            return math.inf
+        return max(1, self.cooldown)
+
+    def update(self, game, dt_ms):
+        self.cooldown -= dt_ms
+        if self.cooldown > 0:
+            return
+        if game.state == "next_level":
+            game.next_level()
+            self.cooldown = self.serve_ms
+        elif game.state == "game" and game.waiting:
+            self.act(game)
+            self.cooldown = self.serve_ms
+        else:
+            self.cooldown = 0
+
+    def act(self, game):
+        # клієнти рівня чекають однаково, тож найменше часу лишилось у першого в черзі
+        order = list(game.order(game.first_customer()))
+        if self.rng.random() < self.mistake_rate:
+            order.pop(self.rng.randrange(len(order)))
+        for name in order:
+            game.toggle_ingredient(name)
+        # помилкове замовлення може підійти іншому клієнту — тоді віддаємо йому
+        if not game.serve_best():
+            game.clear_selection()
+
+    def on_level_done(self):
+        self.cooldown = self.next_level_ms
+
+
+def run_shift(bot, levels=LEVELS, seed=None, max_ms=3_600_000, log=None):
+    """
+    Грає одну зміну до кінця (або max_ms симульованого часу) і повертає підсумок.
+    Крок — до найближчої події гри або дії бота, тож зміна займає десятки кроків, а не тисячі кадрів.
+    З log (input_log.InputLog) зміна записується для replay.py.
+    """
+    game = GameState(levels, seed=seed, log=log)
+    level_index = game.level_index
+    while game.state != "end" and game.clock_ms < max_ms:
+        dt = min(game.time_to_next_event(), bot.time_to_next_action(game))
+        game.step(dt)
+        if game.level_index == level_index:
+            bot.update(game, dt)
+        if game.level_index != level_index:
+            level_index = game.level_index
+            bot.on_level_done()
+    return shift_summary(game)
+
+
+def shift_summary(game):
+    return {
+        "score": game.score,
+        "served": game.served_count,
+        "expired": game.expired_count,
+        "levels_completed": game.level_index,
+        "sim_ms": game.clock_ms,
+    }
+
+
+def simulate(shifts, bot_factory, levels=LEVELS, seed=0):
+    """Грає shifts змін з насінням seed, seed+1, ...; bot_factory(rng) створює бота на кожну зміну."""
+    results = []
+    for i in range(shifts):
+        bot = bot_factory(random.Random(seed + i + 1_000_003))
+        results.append(run_shift(bot, levels, seed + i))
+    return results
+
+
+def summarize(results):
+    n = len(results) or 1
+    return {
+        "shifts": len(results),
+        "avg_score": sum(r["score"] for r in results) / n,
+        "avg_served": sum(r["served"] for r in results) / n,
+        "avg_expired": sum(r["expired"] for r in results) / n,
+        "completed_shifts": sum(1 for r in results if r["levels_completed"] == len(LEVELS)),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Симуляція змін кафе без вікна")
+    parser.add_argument("--shifts", type=int, default=1000)
+    parser.add_argument("--serve-ms", type=int, default=1500)
+    parser.add_argument("--mistake-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--record", metavar="PATH", help="записати першу зміну в журнал для replay.py")
+    args = parser.parse_args()
+
+    if args.record:
+        log = InputLog(args.seed)
+        run_shift(Bot(args.serve_ms, args.mistake_rate, rng=random.Random(args.seed + 1_000_003)),
+                  seed=args.seed, log=log)
+        log.save(args.record)
+        print(f"{len(log)} записів, {log.tick} тактів -> {args.record}")
+
+    t0 = time.perf_counter()
+    results = simulate(args.shifts, lambda rng: Bot(args.serve_ms, args.mistake_rate, rng=rng), seed=args.seed)
+    elapsed = time.perf_counter() - t0
+    for k, v in summarize(results).items():
+        print(f"{k:18} {v}")
+    print(f"{args.shifts / elapsed:.0f} змін/с")
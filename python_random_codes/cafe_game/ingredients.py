@@ -1,4 +1,12 @@
+import itertools
 import random
+from array import array
+from fractions import Fraction
+
+try:
+    import numpy as np
+except ImportError:  # без NumPy пакетна генерація повертає кортежі або бітові маски
+    np = None
 
 INGREDIENTS = {
     "bread": {"color": (200, 180, 100)},
@@ -12,22 +20,84 @@ INGREDIENTS = {
 
 ADDITIONALS = ["fries", "cola", "coffee", "salad"]  # додаємо salad
 
-def generate_order():
+# позиція інгредієнта у векторі кількостей (див. order_key)
+INGREDIENT_INDEX = {name: i for i, name in enumerate(INGREDIENTS)}
+
+
+def order_key(items):
+    """
+    Канонічний ключ мультимножини інгредієнтів: кортеж кількостей у порядку INGREDIENTS.
+    Однакові замовлення в будь-якому порядку дають однаковий ключ, тож його можна класти в dict.
+    """
+    counts = [0] * len(INGREDIENT_INDEX)
+    for name in items:
+        counts[INGREDIENT_INDEX[name]] += 1
+    return tuple(counts)
+
+def generate_order(rng=random):
     """
     Генерує замовлення згідно правил:
     - bread + patty завжди разом (обов'язково)
     - до них може бути доданий cheese (50%)
     - додаткові боки (0..2) випадкові з ADDITIONALS
+    rng — джерело випадковості (модуль random або random.Random).
     Повертає список назв інгредієнтів.
     """
     order = ["bread", "patty"]
 
-    if random.random() < 0.5:
+    if rng.random() < 0.5:
         order.append("cheese")
 
-    n_add = random.randint(0, 2)
+    n_add = rng.randint(0, 2)
     if n_add > 0:
-        sides = random.sample(ADDITIONALS, k=n_add)
+        sides = rng.sample(ADDITIONALS, k=n_add)
         order.extend(sides)
 
     return order
+
+
+# --- Пакетна генерація ---
+# Таблиця всіх можливих замовлень з точними ймовірностями за правилами generate_order:
+# сир — 1/2, кількість боків 0..2 — по 1/3, боки — випадкове впорядковане розміщення з ADDITIONALS.
+def _order_table():
+    table = {}
+    for cheese in (False, True):
+        for n_add in range(3):
+            sides = list(itertools.permutations(ADDITIONALS, n_add))
+            for extra in sides:
+                order = ("bread", "patty") + (("cheese",) if cheese else ()) + extra
+                table[order] = table.get(order, 0) + Fraction(1, 2) * Fraction(1, 3) / len(sides)
+    return table
+
+
+ORDER_TABLE = _order_table()  # кортеж замовлення -> Fraction
+ORDERS = list(ORDER_TABLE)
+ORDER_CUM_WEIGHTS = list(itertools.accumulate(float(p) for p in ORDER_TABLE.values()))
+# кожен інгредієнт трапляється в замовленні не більше разу, тож замовлення — це біт на інгредієнт
+ORDER_MASKS = [sum(1 << INGREDIENT_INDEX[name] for name in order) for order in ORDERS]
+
+
+def generate_orders(n, rng=random):
+    """
+    n замовлень одним викликом rng.choices за таблицею ORDERS.
+    Розподіл той самий, що в generate_order; замовлення — спільні кортежі з ORDERS (не змінювати).
+    """
+    return rng.choices(ORDERS, cum_weights=ORDER_CUM_WEIGHTS, k=n)
+
+
+def generate_order_masks(n, rng=random):
+    """n замовлень як бітові маски над INGREDIENTS (біт INGREDIENT_INDEX[name]) у array('B')."""
+    return array("B", rng.choices(ORDER_MASKS, cum_weights=ORDER_CUM_WEIGHTS, k=n))
+
+
+def generate_order_counts(n, seed=None):
+    """
+    Матриця кількостей n x len(INGREDIENTS) (uint8): рядок i — замовлення i.
+    Потребує NumPy; seed — число або numpy.random.Generator.
+    """
+    if np is None:
+        raise RuntimeError("generate_order_counts потребує NumPy")
+    gen = np.random.default_rng(seed)
+    counts = np.array([order_key(order) for order in ORDERS], dtype=np.uint8)
+    probs = np.array([float(p) for p in ORDER_TABLE.values()])
+    return counts[gen.choice(len(ORDERS), size=n, p=probs / probs.sum())]
@@ -0,0 +1,81 @@
+# input_log.py
+# Компактний бінарний журнал зміни: насіння сесії + записи (такт, подія, аргумент).
+# GameState з log=... сам дописує сюди кожну дію гравця і кожен крок часу,
+# а replay.py програє журнал на новій грі з тим самим насінням.
+import struct
+
+MAGIC = b"CAFE"
+VERSION = 2
+HEADER = struct.Struct("<4sBq")  # магія, версія, насіння
+RECORD = struct.Struct("<IBI")  # такт, подія, аргумент
+
+# Події
+STEP = 0  # аргумент — dt у мс; після нього такт збільшується
+TOGGLE = 1  # аргумент — індекс інгредієнта в game.available_items
+SERVE = 2  # аргумент — слот клієнта в game.store
+SERVE_BEST = 3
+CLEAR = 4
+NEXT_LEVEL = 5
+
+EVENT_NAMES = {STEP: "step", TOGGLE: "toggle", SERVE: "serve", SERVE_BEST: "serve_best",
+               CLEAR: "clear", NEXT_LEVEL: "next_level"}
+
+
+class InputLog:
+    """Журнал однієї зміни. Записи лежать у bytearray по RECORD.size байт."""
+
+    def __init__(self, seed):
+        self.seed = seed
+        self.tick = 0
+        self.data = bytearray()
+
+    def record(self, event, arg=0):
+        self.data += RECORD.pack(self.tick, event, arg)
+        if event == STEP:
+            self.tick += 1
+
+    def __len__(self):
+        return len(self.data) // RECORD.size
+
+    def __iter__(self):
+        """Записи (такт, подія, аргумент) по порядку."""
+        return RECORD.iter_unpack(self.data)
+
+    def save(self, path):
+        if not isinstance(self.seed, int):
+            raise ValueError(f"журнал без цілого насіння не повторити (seed={self.seed!r})")
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed))
+            f.write(self.data)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            raw = f.read()
+        magic, version, seed = HEADER.unpack_from(raw)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: не журнал cafe_game (версії {VERSION})")
+        if (len(raw) - HEADER.size) % RECORD.size:
+            raise ValueError(f"{path}: обрізаний журнал")
+        log = cls(seed)
+        log.data = bytearray(raw[HEADER.size:])
+        log.tick = sum(1 for _, event, _ in log if event == STEP)
+        return log
+
+
+def apply(game, event, arg):
+    """Виконує одну подію журналу над game (так само, як її виконав гравець)."""
+    if event == STEP:
+        game.step(arg)
+    elif event == TOGGLE:
+        game.toggle_ingredient(game.available_items[arg])
+    elif event == SERVE:
+        game.serve(arg)
+    elif event == SERVE_BEST:
+        game.serve_best()
+    elif event == CLEAR:
+        game.clear_selection()
+    elif event == NEXT_LEVEL:
+        game.next_level()
+    else:
+        raise ValueError(f"невідома подія {event}")
@@ -1,172 +1,224 @@
 # main.py
-import pygame, sys, random
-from collections import Counter
-from visuals import draw_customer, draw_ingredient_buttons, draw_ui_top, draw_end_screen
-from ingredients import INGREDIENTS, generate_order
+# Запуск:  python main.py [--seed N] [--record shift.log] [--full-redraw] [--fps 0]
+import argparse
+import pygame, sys
+from visuals import customer_bounds, draw_button, draw_customer, draw_ingredient_buttons, draw_ui_top, draw_end_screen, \
+    timer_color
+from game_state import GameState
+from atlas import Atlas
+from input_log import InputLog
 from level_data import LEVELS  # список рівнів
 
-pygame.init()
-screen = pygame.display.set_mode((900, 600))
-pygame.display.set_caption("Кухня 03:00")
-clock = pygame.time.Clock()
-
-FONT = pygame.font.SysFont("Arial", 18)
-BIG_FONT = pygame.font.SysFont("Arial", 28)
-
-available_items = list(INGREDIENTS.keys())
-selected = []
-customers = []
-score = 0
-served_count = 0
-
-spawned_customers = 0 
-current_level_index = 0
-LEVEL = LEVELS[current_level_index]
-
-time_remaining = LEVEL["level_time"]
-spawn_interval = LEVEL["spawn_interval"]
-spawn_acc = 0.0
-customer_wait_ms = LEVEL["customer_wait_ms"]
-
-def make_customer():
-    colors = [(150, 200, 255), (200, 180, 255), (180, 255, 200), (255, 200, 180)]
-    size_options = [(50, 70), (60, 80), (70, 90)]
-    border_options = [4, 8, 12]
-    return {
-        "order": generate_order(),
-        "wait_ms": customer_wait_ms,
-        "spawn_time": pygame.time.get_ticks(),
-        "color": random.choice(colors),
-        "size": random.choice(size_options),
-        "border_radius": random.choice(border_options)
-    }
-
-# початковий клієнт
-customers.append(make_customer())
-
-state = "game"  # game, next_level, end
-
-while True:
-    dt_ms = clock.tick(60)
-    dt = dt_ms / 1000.0
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-
-        if state == "game" and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            pos = event.pos
-
-            # --- перевірка кліку по інгредієнтах ---
-            base_x = 50; base_y = 430; gap = 14; w = 76; h = 76
-            for i, name in enumerate(available_items):
-                rect = pygame.Rect(base_x + i * (w + gap), base_y, w, h)
-                if rect.collidepoint(pos):
-                    if name in selected:
-                        selected.remove(name)
-                    else:
-                        selected.append(name)
-                    break
-
-            # --- перевірка кліку по клієнтах ---
-            for i, c in enumerate(customers):
-                start_x = 120
-                start_y = 160
-                gap_x = 140
-                x = start_x + i * gap_x
-                y = start_y
-                customer_rect = pygame.Rect(x, y, 60, 80)
-
-                if customer_rect.collidepoint(pos):
-                    if Counter(selected) == Counter(c["order"]):
-                        score += 10
-                        served_count += 1
-                        customers.pop(i)
-                        selected.clear()
-                    break
-
-        elif state in ["next_level", "end"] and event.type == pygame.MOUSEBUTTONDOWN:
-            if state == "next_level":
-                # переходимо на новий рівень
-                LEVEL = LEVELS[current_level_index]
-                time_remaining = LEVEL["level_time"]
-                spawn_interval = LEVEL["spawn_interval"]
-                customer_wait_ms = LEVEL["customer_wait_ms"]
-                spawn_acc = 0.0
-                customers.append(make_customer())
-                state = "game"
-            else:
-                pygame.quit()
-                sys.exit()
-
-    # --- Логіка гри ---
-    if state == "game":
-        time_remaining -= dt
-        spawn_acc += dt
-
-        # спавн нових клієнтів
-        if spawn_acc >= LEVEL["spawn_interval"] and spawned_customers < LEVEL["total_customers"]:
-            customers.append(make_customer())
-            spawned_customers += 1
-            spawn_acc = 0.0
-
-        # оновлення таймера очікування клієнтів
-        new_queue = []
-        for c in customers:
-            c["wait_ms"] -= dt_ms
-            if c["wait_ms"] > 0:
-                new_queue.append(c)
-        customers = new_queue
-        if spawned_customers == LEVEL["total_customers"] and not customers:
-            current_level_index += 1
-            if current_level_index < len(LEVELS):
-                # готуємо наступний рівень
-                LEVEL = LEVELS[current_level_index]
-                time_remaining = LEVEL["level_time"]
-                spawn_acc = 0.0
-                spawned_customers = 0
-                selected.clear()
-                customers.clear()
-                state = "game"
-            else:
-                state = "end"
+# Розкладка екрана (кнопки інгредієнтів і ряд клієнтів)
+BUTTONS_X = 50
+BUTTONS_Y = 430
+BUTTON_GAP = 14
+BUTTON_SIZE = 76
+CUSTOMERS_X = 120
+CUSTOMERS_Y = 160
+CUSTOMERS_GAP = 140
+BACKGROUND = (28, 28, 36)
 
-        # --- Малювання ---
-        screen.fill((28, 28, 36))
-        draw_ui_top(screen, time_remaining, score, BIG_FONT)
+# Логіка крокує фіксованим тактом незалежно від частоти кадрів
+TICK_MS = 10
+MAX_CATCHUP_STEPS = 25  # більше кроків за кадр не робимо — гра сповільнюється, а не застрягає
+
+
+def customer_pos(i):
+    return CUSTOMERS_X + i * CUSTOMERS_GAP, CUSTOMERS_Y
+
+
+def handle_click(game, pos):
+    # --- перевірка кліку по інгредієнтах ---
+    for i, name in enumerate(game.available_items):
+        rect = pygame.Rect(BUTTONS_X + i * (BUTTON_SIZE + BUTTON_GAP), BUTTONS_Y, BUTTON_SIZE, BUTTON_SIZE)
+        if rect.collidepoint(pos):
+            game.toggle_ingredient(name)
+            break
+
+    # --- перевірка кліку по клієнтах ---
+    for i, slot in enumerate(game.customers):
+        x, y = customer_pos(i)
+        if pygame.Rect(x, y, 60, 80).collidepoint(pos):
+            game.serve(slot)
+            break
+
+
+def draw(screen, game, fonts, atlas=None, lag_ms=0):
+    """lag_ms — час, накопичений після останнього кроку логіки; таймери малюються з поправкою на нього."""
+    font, big_font = fonts
+    if game.state == "game":
+        screen.fill(BACKGROUND)
+        draw_ui_top(screen, game.time_remaining - lag_ms / 1000, game.score, big_font, atlas)
 
         # Малюємо клієнтів у ряд
-        start_x = 120
-        start_y = 160
-        gap_x = 140
-
-        for i, c in enumerate(customers):
-            x = start_x + i * gap_x
-            y = start_y
-            progress = max(0.0, c["wait_ms"] / customer_wait_ms)
-            draw_customer(screen, x, y, c["order"], FONT, progress=progress)
-
-        draw_ingredient_buttons(screen, available_items, selected, FONT)
-
-        pygame.display.flip()
-
-        # перевірка завершення рівня
-        if not customers:
-            current_level_index += 1
-            if current_level_index < len(LEVELS):
-                state = "next_level"
-                spawned_customers = 0 
-            else:
-                state = "end"
+        for i, slot in enumerate(game.customers):
+            x, y = customer_pos(i)
+            draw_customer(screen, x, y, game.order(slot), font, progress=game.progress(slot, lag_ms),
+                          c=game.appearance(slot), atlas=atlas)
+
+        draw_ingredient_buttons(screen, game.available_items, game.selected, font, atlas=atlas)
 
-    elif state == "next_level":
+    elif game.state == "next_level":
         # показ повідомлення "Рівень пройдено!"
-        screen.fill((28, 28, 36))
-        txt = BIG_FONT.render(f"Рівень пройдено! Натисни, щоб перейти", True, (255, 255, 255))
+        screen.fill(BACKGROUND)
+        txt = atlas.text(big_font, "Рівень пройдено! Натисни, щоб перейти", (255, 255, 255)) if atlas else \
+            big_font.render("Рівень пройдено! Натисни, щоб перейти", True, (255, 255, 255))
         screen.blit(txt, (screen.get_width()//2 - txt.get_width()//2, screen.get_height()//2 - txt.get_height()//2))
-        pygame.display.flip()
 
-    elif state == "end":
-        draw_end_screen(screen, score, served_count, BIG_FONT, FONT)
-        pygame.display.flip()
+    elif game.state == "end":
+        draw_end_screen(screen, game.score, game.served_count, big_font, font, atlas)
+
+
+class DirtyRenderer:
+    """
+    Перемальовує лише те, що змінилось між кадрами, і віддає змінені прямокутники в display.update.
+    Кадр гри описується елементами {слот: (підпис, прямокутник, малювання)}; якщо підпис слота
+    змінився (інший клієнт, ширина таймбара, вибір кнопки, текст рахунку), його стара й нова
+    області очищаються, і в них перемальовуються всі елементи, що їх зачіпають.
+    Екрани "next_level" та "end" малюються один раз при вході в стан.
+    """
+
+    def __init__(self, screen, fonts, atlas=None):
+        self.screen = screen
+        self.fonts = fonts
+        self.atlas = atlas
+        self.items = {}
+        self.scene = None
+
+    def render(self, game, lag_ms=0):
+        scene = (game.state, game.level_index)
+        if scene != self.scene:
+            # новий екран — повне малювання один раз
+            self.scene = scene
+            draw(self.screen, game, self.fonts, self.atlas, lag_ms)
+            self.items = self.frame_items(game, lag_ms) if game.state == "game" else {}
+            pygame.display.flip()
+            return
+        if game.state != "game":
+            return
+
+        items = self.frame_items(game, lag_ms)
+        dirty = []
+        for slot in self.items.keys() | items.keys():
+            old, new = self.items.get(slot), items.get(slot)
+            if old is not None and new is not None and old[0] == new[0] and old[1] == new[1]:
+                continue
+            dirty.extend(item[1] for item in (old, new) if item is not None)
+        self.items = items
+        if not dirty:
+            return
+
+        screen = self.screen
+        for rect in dirty:
+            screen.set_clip(rect)
+            screen.fill(BACKGROUND, rect)
+            for _, item_rect, paint in items.values():
+                if item_rect.colliderect(rect):
+                    paint()
+        screen.set_clip(None)
+        pygame.display.update(dirty)
+
+    def frame_items(self, game, lag_ms=0):
+        screen, atlas = self.screen, self.atlas
+        font, big_font = self.fonts
+        items = {}
+
+        time_left = game.time_remaining - lag_ms / 1000
+        txt = f"Час: {int(time_left)}    Очки: {game.score}"
+        items["ui"] = (txt, pygame.Rect((20, 16), big_font.size(txt)),
+                       lambda: draw_ui_top(screen, time_left, game.score, big_font, atlas))
+
+        for i, slot in enumerate(game.customers):
+            x, y = customer_pos(i)
+            c, order, progress = game.appearance(slot), game.order(slot), game.progress(slot, lag_ms)
+            # слоти сховища перевикористовуються, тож клієнта впізнаємо ще й за часом появи;
+            # таймбар змінюється і шириною, і кольором — обидва входять у підпис
+            sign = (slot, game.spawn_time(slot), int(c["size"][0] * progress), timer_color(progress))
+            items["customer", i] = (sign, customer_bounds(x, y, order, c),
+                                    lambda x=x, y=y, c=c, order=order, p=progress:
+                                    draw_customer(screen, x, y, order, font, progress=p, c=c, atlas=atlas))
+
+        for i, name in enumerate(game.available_items):
+            rect = pygame.Rect(BUTTONS_X + i * (BUTTON_SIZE + BUTTON_GAP), BUTTONS_Y, BUTTON_SIZE, BUTTON_SIZE)
+            selected = name in game.selected
+            if atlas is not None:
+                paint = lambda rect=rect, name=name, selected=selected: \
+                    screen.blit(atlas.button(name, selected, rect.size), rect)
+            else:
+                paint = lambda rect=rect, name=name, selected=selected: \
+                    draw_button(screen, rect, name, selected, font)
+            items["button", i] = (selected, rect, paint)
+        return items
+
+
+def quit_game(game, record=None):
+    if record:
+        game.log.save(record)
+    pygame.quit()
+    sys.exit()
+
+
+def main(dirty_rects=True, seed=None, record=None, fps=60):
+    """fps — обмеження частоти кадрів (0 — без обмеження); на швидкість логіки не впливає."""
+    pygame.init()
+    screen = pygame.display.set_mode((900, 600))
+    pygame.display.set_caption("Кухня 03:00")
+    clock = pygame.time.Clock()
+
+    FONT = pygame.font.SysFont("Arial", 18)
+    BIG_FONT = pygame.font.SysFont("Arial", 28)
+    atlas = Atlas(FONT)
+
+    game = GameState(LEVELS, seed=seed)
+    if record:
+        game.log = InputLog(game.seed)
+    renderer = DirtyRenderer(screen, (FONT, BIG_FONT), atlas) if dirty_rects else None
+
+    lag_ms = 0
+    while True:
+        lag_ms += clock.tick(fps)
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                quit_game(game, record)
+
+            # пробіл — віддати вибране найнетерплячішому клієнту з таким замовленням
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE and game.state == "game":
+                game.serve_best()
+
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if game.state == "game" and event.button == 1:
+                    handle_click(game, event.pos)
+                elif game.state == "next_level":
+                    # переходимо на новий рівень
+                    game.next_level()
+                elif game.state == "end":
+                    quit_game(game, record)
+
+        # --- Логіка гри: стільки кроків TICK_MS, скільки накопичилось ---
+        steps = 0
+        while lag_ms >= TICK_MS and steps < MAX_CATCHUP_STEPS:
+            game.step(TICK_MS)
+            lag_ms -= TICK_MS
+            steps += 1
+        if steps == MAX_CATCHUP_STEPS:
+            # кадр затягнувся — решту відставання відкидаємо
+            lag_ms %= TICK_MS
+
+        # --- Малювання ---
+        if renderer is not None:
+            renderer.render(game, lag_ms)
+        else:
+            draw(screen, game, (FONT, BIG_FONT), atlas, lag_ms)
+            pygame.display.flip()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Кухня 03:00")
+    parser.add_argument("--seed", type=int, default=None, help="насіння сесії (за замовчуванням — випадкове)")
+    parser.add_argument("--record", metavar="PATH", help="записати зміну в журнал для replay.py")
+    parser.add_argument("--full-redraw", action="store_true", help="старий режим: весь екран і flip() щокадру")
+    parser.add_argument("--fps", type=int, default=60, help="обмеження кадрів за секунду (0 — без обмеження)")
+    args = parser.parse_args()
+    main(dirty_rects=not args.full_redraw, seed=args.seed, record=args.record, fps=args.fps)
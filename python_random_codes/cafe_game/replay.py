@@ -0,0 +1,69 @@
+# replay.py
+# Повтор записаної зміни: нова гра з насінням журналу отримує ті самі події, тож результат збігається.
+# Запуск:  python replay.py shift.log              # без вікна, як фіксоване навантаження для бенчмарку
+#          python replay.py shift.log --render     # з малюванням кожного кадру (без обмеження FPS)
+import argparse
+import time
+
+from game_state import GameState
+from headless import shift_summary
+from input_log import STEP, InputLog, apply
+from level_data import LEVELS
+
+
+def replay(log, levels=LEVELS, render=False, full_redraw=False):
+    """Програє журнал і повертає підсумок зміни (як run_shift) разом із кількістю кадрів."""
+    game = GameState(levels, seed=log.seed)
+    draw_frame = _make_renderer(game, full_redraw) if render else None
+    frames = 0
+    for _, event, arg in log:
+        apply(game, event, arg)
+        if event == STEP:
+            frames += 1
+            if draw_frame is not None:
+                draw_frame()
+    result = shift_summary(game)
+    result["frames"] = frames
+    return result
+
+
+def _make_renderer(game, full_redraw):
+    # pygame потрібен лише для повтору з вікном
+    import pygame
+    from atlas import Atlas
+    from main import DirtyRenderer, draw
+
+    pygame.init()
+    screen = pygame.display.set_mode((900, 600))
+    pygame.display.set_caption("Кухня 03:00 — повтор")
+    fonts = (pygame.font.SysFont("Arial", 18), pygame.font.SysFont("Arial", 28))
+    atlas = Atlas(fonts[0])
+    renderer = DirtyRenderer(screen, fonts, atlas)
+
+    def draw_frame():
+        pygame.event.pump()
+        if full_redraw:
+            draw(screen, game, fonts, atlas)
+            pygame.display.flip()
+        else:
+            renderer.render(game)
+
+    return draw_frame
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Повтор записаної зміни кафе")
+    parser.add_argument("log")
+    parser.add_argument("--render", action="store_true", help="малювати кожен кадр у вікні")
+    parser.add_argument("--full-redraw", action="store_true", help="з --render: весь екран щокадру")
+    parser.add_argument("--repeat", type=int, default=1, help="скільки разів програти (для заміру часу)")
+    args = parser.parse_args()
+
+    log = InputLog.load(args.log)
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        result = replay(log, render=args.render, full_redraw=args.full_redraw)
+    elapsed = time.perf_counter() - t0
+    for k, v in result.items():
+        print(f"{k:18} {v}")
+    print(f"{args.repeat * result['frames'] / elapsed:.0f} кадрів/с")
@@ -0,0 +1,134 @@
+# sweep.py
+# Перебір параметрів рівня: для кожної конфігурації сітки — багато змін без вікна на пулі процесів.
+# Запуск:  python sweep.py --spawn-interval 1 2 3 4 --customer-wait-ms 6000 8000 10000 12000 \
+#                          --total-customers 3 5 7 --shifts 20 --out sweep.csv
+#          python sweep.py --level 2 ...   # підставити сітку в LEVELS[2] і грати всю зміну
+import argparse
+import csv
+import itertools
+import os
+import random
+import statistics
+import sys
+import time
+from multiprocessing import Pool
+
+from headless import Bot, run_shift
+from level_data import LEVELS
+
+# level_time не перебираємо: гра лише показує таймер, а рівень закінчується, коли обслужено
+# чи відпущено всіх клієнтів, тож на результат зміни він не впливає
+LEVEL_PARAMS = ["spawn_interval", "customer_wait_ms", "total_customers"]
+BOT_PARAMS = ["serve_ms", "mistake_rate"]
+COLUMNS = LEVEL_PARAMS + BOT_PARAMS + [
+    "shifts", "score_mean", "served_mean", "served_std", "served_p10", "served_p50", "served_p90",
+    "expired_mean", "expired_std", "expired_p90", "completed_rate",
+]
+
+
+def build_grid(params):
+    """{назва: [значення, ...]} -> список словників-конфігурацій (декартів добуток)."""
+    names = list(params)
+    return [dict(zip(names, values)) for values in itertools.product(*(params[n] for n in names))]
+
+
+def make_levels(config, level=None):
+    """Рівні для конфігурації: один рівень із сітки або LEVELS з підміненим рівнем level."""
+    overrides = {k: config[k] for k in LEVEL_PARAMS}
+    if level is None:
+        return [dict(LEVELS[0], **overrides)]
+    levels = [dict(lvl) for lvl in LEVELS]
+    levels[level].update(overrides)
+    return levels
+
+
+def evaluate(job):
+    """Грає shifts змін однієї конфігурації (насіння seed..seed+shifts-1) і повертає рядок таблиці."""
+    config, shifts, seed, level = job
+    levels = make_levels(config, level)
+    served, expired, scores, completed = [], [], [], 0
+    for i in range(shifts):
+        bot = Bot(config["serve_ms"], config["mistake_rate"], rng=random.Random(seed + i + 1_000_003))
+        r = run_shift(bot, levels, seed + i)
+        served.append(r["served"])
+        expired.append(r["expired"])
+        scores.append(r["score"])
+        completed += r["levels_completed"] == len(levels)
+
+    row = dict(config)
+    row.update({
+        "shifts": shifts,
+        "score_mean": statistics.fmean(scores),
+        "served_mean": statistics.fmean(served),
+        "served_std": statistics.pstdev(served),
+        "served_p10": _percentile(served, 10),
+        "served_p50": _percentile(served, 50),
+        "served_p90": _percentile(served, 90),
+        "expired_mean": statistics.fmean(expired),
+        "expired_std": statistics.pstdev(expired),
+        "expired_p90": _percentile(expired, 90),
+        "completed_rate": completed / shifts,
+    })
+    return row
+
+
+def _percentile(values, p):
+    s = sorted(values)
+    return s[min(len(s) - 1, len(s) * p // 100)]
+
+
+def run_sweep(grid, shifts=20, seed=0, level=None, workers=None, progress=True):
+    jobs = [(config, shifts, seed, level) for config in grid]
+    workers = workers or os.cpu_count() or 1
+    rows = []
+    t0 = time.perf_counter()
+    # великі порції зменшують накладні витрати на передачу задач між процесами
+    chunksize = max(1, len(jobs) // (workers * 8))
+    with Pool(workers) as pool:
+        for i, row in enumerate(pool.imap_unordered(evaluate, jobs, chunksize=chunksize), 1):
+            rows.append(row)
+            if progress and (i % 500 == 0 or i == len(jobs)):
+                print(f"{i}/{len(jobs)} конфігурацій, {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+    rows.sort(key=lambda r: [r[k] for k in LEVEL_PARAMS + BOT_PARAMS])
+    return rows
+
+
+def write_table(rows, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: round(v, 3) if isinstance(v, float) else v for k, v in row.items()})
+
+
+def main(argv=None):
+    base = LEVELS[0]
+    parser = argparse.ArgumentParser(description="Перебір параметрів рівнів кафе")
+    parser.add_argument("--spawn-interval", type=float, nargs="+", default=[base["spawn_interval"]])
+    parser.add_argument("--customer-wait-ms", type=int, nargs="+", default=[base["customer_wait_ms"]])
+    parser.add_argument("--total-customers", type=int, nargs="+", default=[base["total_customers"]])
+    parser.add_argument("--serve-ms", type=int, nargs="+", default=[1500], help="швидкість бота")
+    parser.add_argument("--mistake-rate", type=float, nargs="+", default=[0.1])
+    parser.add_argument("--level", type=int, default=None,
+                        help="підставляти сітку в LEVELS[level] (інакше — зміна з одного рівня)")
+    parser.add_argument("--shifts", type=int, default=20, help="змін на конфігурацію")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default="sweep.csv")
+    args = parser.parse_args(argv)
+
+    grid = build_grid({
+        "spawn_interval": args.spawn_interval,
+        "customer_wait_ms": args.customer_wait_ms,
+        "total_customers": args.total_customers,
+        "serve_ms": args.serve_ms,
+        "mistake_rate": args.mistake_rate,
+    })
+    rows = run_sweep(grid, args.shifts, args.seed, args.level, args.workers)
+    write_table(rows, args.out)
+    print(f"{len(rows)} конфігурацій -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,17 @@
 # visuals.py
 import pygame
 from ingredients import INGREDIENTS
-import random
 
 ICON_SIZE = 28
 
-def draw_customer(screen, x, y, order, font, progress=None, c=None):
+def draw_customer(screen, x, y, order, font, progress=None, c=None, atlas=None):
     """
     Малює клієнта:
     - різний колір, розмір та border_radius
-    - очі та рот
+    - очі та рот (c["smile"]: усмішка чи нейтральний)
     - замовлення над головою
     - таймбар з градієнтом (зелений → жовтий → червоний)
+    З atlas тіло та іконки беруться готовими поверхнями (blit), без малювання примітивів.
     """
     # параметри клієнта
     if c is None:
@@ -19,22 +19,13 @@ def draw_customer(screen, x, y, order, font, progress=None, c=None):
     color = c.get("color", (150, 200, 255))
     w, h = c.get("size", (60, 80))
     radius = c.get("border_radius", 8)
+    smile = c.get("smile", False)
 
     # тіло
-    customer_rect = pygame.Rect(x, y, w, h)
-    pygame.draw.rect(screen, color, customer_rect, border_radius=radius)
-
-    # очі
-    eye_y = y + int(h*0.2)
-    pygame.draw.circle(screen, (0,0,0), (x + int(w*0.25), eye_y), 4)
-    pygame.draw.circle(screen, (0,0,0), (x + int(w*0.75), eye_y), 4)
-
-    # рот
-    mouth_y = y + int(h*0.75)
-    if random.random() < 0.5:
-        pygame.draw.rect(screen, (255, 0, 0), (x + int(w*0.25), mouth_y, int(w*0.5), 4))  # усмішка
+    if atlas is not None:
+        screen.blit(atlas.body(color, (w, h), radius, smile), (x, y))
     else:
-        pygame.draw.rect(screen, (0, 0, 0), (x + int(w*0.25), mouth_y, int(w*0.5), 4))  # нейтральний рот
+        draw_body(screen, x, y, color, (w, h), radius, smile)
 
     # Малюємо замовлення над головою
     start_x = x - (len(order)-1) * (ICON_SIZE + 6) // 2 + w//2 - ICON_SIZE//2
@@ -42,10 +33,10 @@ def draw_customer(screen, x, y, order, font, progress=None, c=None):
     for i, item in enumerate(order):
         cx = start_x + i * (ICON_SIZE + 6)
         cy = base_y
-        color_i = INGREDIENTS[item]["color"]
-        pygame.draw.rect(screen, color_i, (cx, cy, ICON_SIZE, ICON_SIZE), border_radius=4)
-        label = font.render(item[0].upper(), True, (0,0,0))
-        screen.blit(label, (cx + 6, cy + 4))
+        if atlas is not None:
+            screen.blit(atlas.icon(item), (cx, cy))
+        else:
+            draw_icon(screen, cx, cy, item, font)
 
     # Таймбар з градієнтним кольором
     if progress is not None:
@@ -54,24 +45,69 @@ def draw_customer(screen, x, y, order, font, progress=None, c=None):
         bx = x
         by = y - 50
         pygame.draw.rect(screen, (60, 60, 60), (bx, by, bar_w, bar_h))  # фон
+        pygame.draw.rect(screen, timer_color(progress), (bx, by, int(bar_w * progress), bar_h))
 
-        # визначаємо колір: зелений → жовтий → червоний
-        if progress > 0.5:
-            # зелений → жовтий
-            ratio = (progress - 0.5) / 0.5
-            r = int(255 * (1 - ratio))
-            g = 255
-        else:
-            # жовтий → червоний
-            ratio = progress / 0.5
-            r = 255
-            g = int(255 * ratio)
-        b = 0
 
-        pygame.draw.rect(screen, (r, g, b), (bx, by, int(bar_w * progress), bar_h))
+def timer_color(progress):
+    """Колір таймбару для частки часу progress: зелений → жовтий → червоний."""
+    if progress > 0.5:
+        # зелений → жовтий
+        ratio = (progress - 0.5) / 0.5
+        r = int(255 * (1 - ratio))
+        g = 255
+    else:
+        # жовтий → червоний
+        ratio = progress / 0.5
+        r = 255
+        g = int(255 * ratio)
+    return (r, g, 0)
+
+
+def customer_bounds(x, y, order, c=None):
+    """Прямокутник, який займає клієнт разом із замовленням і таймбаром (для часткового перемальовування)."""
+    w, h = (c or {}).get("size", (60, 80))
+    icons_w = len(order) * (ICON_SIZE + 6) - 6
+    start_x = x - (len(order)-1) * (ICON_SIZE + 6) // 2 + w//2 - ICON_SIZE//2
+    left = min(x, start_x)
+    right = max(x + w, start_x + icons_w)
+    return pygame.Rect(left, y - 50, right - left, h + 50)
 
 
-def draw_ingredient_buttons(screen, items, selected, font, base_x=50, base_y=430):
+def draw_body(surface, x, y, color, size, radius, smile):
+    """Тіло клієнта з очима та ротом (усмішка або нейтральний рот)."""
+    w, h = size
+    pygame.draw.rect(surface, color, pygame.Rect(x, y, w, h), border_radius=radius)
+
+    # очі
+    eye_y = y + int(h*0.2)
+    pygame.draw.circle(surface, (0,0,0), (x + int(w*0.25), eye_y), 4)
+    pygame.draw.circle(surface, (0,0,0), (x + int(w*0.75), eye_y), 4)
+
+    # рот
+    mouth_y = y + int(h*0.75)
+    if smile:
+        pygame.draw.rect(surface, (255, 0, 0), (x + int(w*0.25), mouth_y, int(w*0.5), 4))  # усмішка
+    else:
+        pygame.draw.rect(surface, (0, 0, 0), (x + int(w*0.25), mouth_y, int(w*0.5), 4))  # нейтральний рот
+
+
+def draw_icon(surface, x, y, item, font):
+    """Іконка інгредієнта в замовленні: кольоровий квадрат з першою літерою."""
+    pygame.draw.rect(surface, INGREDIENTS[item]["color"], (x, y, ICON_SIZE, ICON_SIZE), border_radius=4)
+    label = font.render(item[0].upper(), True, (0,0,0))
+    surface.blit(label, (x + 6, y + 4))
+
+
+def draw_button(surface, rect, name, selected, font):
+    """Одна кнопка інгредієнта (з червоною рамкою, якщо вибрана)."""
+    pygame.draw.rect(surface, INGREDIENTS[name]["color"], rect, border_radius=8)
+    if selected:
+        pygame.draw.rect(surface, (255, 0, 0), rect, 4)
+    lbl = font.render(name, True, (0,0,0))
+    surface.blit(lbl, (rect.x + 6, rect.y + rect.h//2 - 10))
+
+
+def draw_ingredient_buttons(screen, items, selected, font, base_x=50, base_y=430, atlas=None):
     """Малює кнопки інгредієнтів."""
     rects = []
     gap = 14
@@ -82,32 +118,41 @@ def draw_ingredient_buttons(screen, items, selected, font, base_x=50, base_y=430
         y = base_y
         rect = pygame.Rect(x, y, w, h)
         rects.append(rect)
-        color = INGREDIENTS[name]["color"]
-        pygame.draw.rect(screen, color, rect, border_radius=8)
-        if name in selected:
-            pygame.draw.rect(screen, (255, 0, 0), rect, 4)
-        lbl = font.render(name, True, (0,0,0))
-        screen.blit(lbl, (x + 6, y + h//2 - 10))
+        if atlas is not None:
+            screen.blit(atlas.button(name, name in selected, (w, h)), rect)
+        else:
+            draw_button(screen, rect, name, name in selected, font)
     return rects
 
 
-def draw_ui_top(screen, time_left_sec, score, font):
+def draw_ui_top(screen, time_left_sec, score, font, atlas=None):
     txt = f"Час: {int(time_left_sec)}    Очки: {score}"
-    label = font.render(txt, True, (255,255,255))
+    if atlas is not None:
+        label = atlas.text(font, txt, (255,255,255))
+    else:
+        label = font.render(txt, True, (255,255,255))
     screen.blit(label, (20, 16))
 
 
-def draw_end_screen(screen, score, served, font_big, font_small):
+_overlays = {}
+
+
+def draw_end_screen(screen, score, served, font_big, font_small, atlas=None):
     """Показує напівпрозорий екран результатів."""
-    overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
+    # затемнення створюється один раз на розмір екрана
+    size = screen.get_size()
+    overlay = _overlays.get(size)
+    if overlay is None:
+        overlay = _overlays[size] = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
     screen.blit(overlay, (0, 0))
 
     center_x, center_y = screen.get_width()//2, screen.get_height()//2
-    text1 = font_big.render("Кінець зміни", True, (255, 255, 255))
-    text2 = font_small.render(f"Очки: {score}", True, (255, 255, 255))
-    text3 = font_small.render(f"Обслужено клієнтів: {served}", True, (255, 255, 255))
-    text4 = font_small.render("Натисни будь-де, щоб вийти", True, (200, 200, 200))
+    render = atlas.text if atlas is not None else (lambda font, text, color: font.render(text, True, color))
+    text1 = render(font_big, "Кінець зміни", (255, 255, 255))
+    text2 = render(font_small, f"Очки: {score}", (255, 255, 255))
+    text3 = render(font_small, f"Обслужено клієнтів: {served}", (255, 255, 255))
+    text4 = render(font_small, "Натисни будь-де, щоб вийти", (200, 200, 200))
 
     screen.blit(text1, (center_x - text1.get_width()//2, center_y - 80))
     screen.blit(text2, (center_x - text2.get_width()//2, center_y - 20))
@@ -1,5 +1,7 @@
+import argparse
+
+import numpy as np
 import pygame
-import random
 
 # --- Налаштування ---
 WIDTH, HEIGHT = 800, 600
@@ -13,119 +15,552 @@ PUDDLE_COLOR = (20, 20, 50)
 FRISK_COLOR = (255, 200, 200)
 FRISK_REFLECTION_COLOR = (200, 160, 160)
 RAIN_COLOR = (170, 200, 255)
+RIPPLE_COLOR = (90, 110, 170)
 
-pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Frisk on the Dark Path")
-clock = pygame.time.Clock()
+rng = np.random.default_rng()
 
 # --- Зірки ---
 NUM_STARS = 100
-stars = []
-for _ in range(NUM_STARS):
-    x = random.randint(0, WIDTH)
-    y = random.randint(0, HEIGHT // 2)
-    brightness = random.randint(150, 255)
-    stars.append([x, y, brightness, random.choice([-1, 1])])
+# зірка — круг радіуса 2: зсуви пікселів відносно центру
+_dx, _dy = np.mgrid[-2:3, -2:3]
+_disc = _dx * _dx + _dy * _dy <= 4
+STAR_DX, STAR_DY = _dx[_disc], _dy[_disc]
+
+
+class Stars:
+    """
+    Зірки як масиви (struct of arrays): координати, яскравість і напрям мерехтіння.
+    x — у межах [0, width] (у світі зі шматками — відносно початку шматка).
+    """
+
+    def __init__(self, n, width=WIDTH, rng=rng):
+        self.x = rng.integers(0, width + 1, n)
+        self.y = rng.integers(0, HEIGHT // 2 + 1, n)
+        self.brightness = rng.integers(150, 256, n).astype(np.int16)
+        self.direction = rng.choice(np.array([-1, 1], dtype=np.int16), n)
+
+    def twinkle(self):
+        """Крок мерехтіння для всіх зірок одразу: яскравість ходить між 150 і 255."""
+        b = self.brightness
+        b += self.direction * 2
+        over = b > 255
+        b[over] = 255
+        self.direction[over] = -1
+        under = b < 150
+        b[under] = 150
+        self.direction[under] = 1
+
+    def draw(self, pixels, offset_x=0):
+        """Штампує всі зірки в pixels (surfarray.pixels3d) однією операцією, зсунувши на offset_x."""
+        width, height = pixels.shape[:2]
+        xs = (self.x + offset_x)[:, None] + STAR_DX
+        ys = self.y[:, None] + STAR_DY
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        gray = np.broadcast_to(self.brightness[:, None], xs.shape)[inside].astype(np.uint8)
+        pixels[xs[inside], ys[inside]] = gray[:, None]
+
 
 # --- Дощ ---
 NUM_RAINDROPS = 150
-raindrops = []
-for _ in range(NUM_RAINDROPS):
-    x = random.randint(0, WIDTH)
-    y = random.randint(0, HEIGHT)
-    length = random.randint(10, 20)
-    speed = random.uniform(4, 8)
-    raindrops.append([x, y, length, speed])
+DROP_MIN_LEN, DROP_MAX_LEN = 10, 20
+LINE_OFFSETS = np.arange(DROP_MAX_LEN + 1, dtype=np.int32)
+
+
+class Rain:
+    """
+    Краплі як масиви: x, y, довжина, швидкість і висота land, на якій крапля торкається землі
+    (десь на стежці). Оновлення, перевірка приземлення і перезапуск — векторні,
+    а малювання — запис усіх пікселів ліній у буфер surfarray за раз.
+    Буфери покриття й масок виділяються один раз на розмір вікна; за кадр numpy ще створює
+    тимчасові масиви (довжини n і результати bincount), але жодного об'єкта на краплю.
+    """
+
+    def __init__(self, n):
+        self.x = rng.integers(0, WIDTH, n).astype(np.int32)
+        self.y = rng.uniform(0, HEIGHT, n).astype(np.float32)
+        self.length = rng.integers(DROP_MIN_LEN, DROP_MAX_LEN + 1, n).astype(np.int32)
+        self.speed = rng.uniform(4, 8, n).astype(np.float32)
+        self.land = rng.uniform(path_top, HEIGHT, n).astype(np.float32)
+        self._tip = np.empty(n, dtype=np.float32)
+        self._y0 = np.empty(n, dtype=np.int32)
+        self._y1 = np.empty(n, dtype=np.int32)
+        self._size = None
+        # що зафарбовано минулого кадру (None — нічого), його стирає erase():
+        # маска розміру вікна або, для рідкого дощу, пара масивів (xs, ys)
+        self.drawn = None
+
+    def update(self, width=WIDTH, hit_test=None):
+        """
+        Зсуває всі краплі. Ті, чий кінчик цього кадру перетнув висоту land у точці, де hit_test(x, y)
+        повертає True (калюжа), приземляються; вони й ті, що впали за HEIGHT, перезапускаються
+        над екраном (по x — у межах width, ширини вікна).
+        Повертає координати приземлень (x, y) на екрані.
+        """
+        tip = np.add(self.y, self.length, out=self._tip)
+        crossing = tip < self.land
+        self.y += self.speed
+        np.add(self.y, self.length, out=tip)
+        crossing &= tip >= self.land
+        landed = np.flatnonzero(crossing)
+        if hit_test is not None and landed.size:
+            landed = landed[hit_test(self.x[landed], self.land[landed])]
+        else:
+            landed = landed[:0]
+        land_x, land_y = self.x[landed], self.land[landed].astype(np.int32)
+
+        self.y[landed] = HEIGHT + 1  # приземлені перезапускаються разом з тими, що впали
+        fallen = np.flatnonzero(self.y > HEIGHT)
+        k = fallen.size
+        if k:
+            self.x[fallen] = rng.integers(0, width, k)
+            self.y[fallen] = rng.integers(-50, -9, k)
+            self.length[fallen] = rng.integers(DROP_MIN_LEN, DROP_MAX_LEN + 1, k)
+            self.speed[fallen] = rng.uniform(4, 8, k)
+            self.land[fallen] = rng.uniform(path_top, HEIGHT, k)
+        return land_x, land_y
+
+    def _buffers(self, size):
+        if size != self._size:
+            width, height = size
+            self._size = size
+            self._coverage = np.empty((width, height + 1), dtype=np.int32)
+            self._masks = [np.zeros(size, dtype=bool), np.zeros(size, dtype=bool)]
+            self.drawn = None
+        return self._coverage, self._masks
+
+    def draw(self, pixels, color):
+        """
+        Растеризує всі вертикальні лінії (x, y) -> (x, y + довжина) у pixels (surfarray.pixels2d),
+        color — колір у форматі поверхні (screen.map_rgb).
+        Лінія дає +1 на початку і -1 після кінця свого стовпця; накопичена сума по y > 0 —
+        це пікселі дощу. Так ціна — O(n) на краплі плюс один прохід по екрану, без пікселя за пікселем.
+        """
+        width, height = pixels.shape
+        # поки пікселів ліній менше, ніж пікселів екрана, дешевше писати їх напряму, ніж рахувати покриття
+        if self.x.size * len(LINE_OFFSETS) < width * height:
+            self._draw_sparse(pixels, color)
+            return
+        coverage, masks = self._buffers((width, height))
+        y0, y1 = self._y0, self._y1
+        np.copyto(y0, self.y, casting="unsafe")
+        np.add(y0, self.length + 1, out=y1)
+        np.clip(y0, 0, height, out=y0)
+        np.clip(y1, 0, height, out=y1)
+        # краплі за правим краєм вікна (після звуження) не малюються
+        outside = self.x >= width
+        y1[outside] = y0[outside]
+        column = np.minimum(self.x, width - 1) * (height + 1)
+        size = width * (height + 1)
+        edges = np.bincount(column + y0, minlength=size) - np.bincount(column + y1, minlength=size)
+        np.cumsum(edges.reshape(width, height + 1), axis=1, out=coverage)
+
+        mask = masks[1] if self.drawn is masks[0] else masks[0]
+        np.greater(coverage[:, :height], 0, out=mask)
+        np.copyto(pixels, color, where=mask)
+        self.drawn = mask
+
+    def _draw_sparse(self, pixels, color):
+        # кілька сотень крапель: пікселі кожної лінії пишуться напряму
+        width, height = pixels.shape
+        ys = self.y.astype(np.int32)[:, None] + LINE_OFFSETS
+        mask = (LINE_OFFSETS <= self.length[:, None]) & (ys >= 0) & (ys < height) & (self.x[:, None] < width)
+        xs = np.broadcast_to(self.x[:, None], ys.shape)[mask]
+        ys = ys[mask]
+        pixels[xs, ys] = color
+        self.drawn = (xs, ys)
+
+    def erase(self, pixels, background):
+        """Повертає фон під лініями минулого кадру (pixels і background — pixels2d/array2d)."""
+        drawn = self.drawn
+        if isinstance(drawn, tuple):
+            xs, ys = drawn
+            pixels[xs, ys] = background[xs, ys]
+        elif drawn is not None and drawn.shape == pixels.shape:
+            np.copyto(pixels, background, where=drawn)
+
+# --- Бризки ---
+SPLASH_CAPACITY = 8192  # місткість пулу; коли він повний, перезаписуються найстаріші
+SPLASH_DROPLETS = 3  # бризок на одне приземлення (плюс одне коло)
+SPLASH_GRAVITY = 0.35
+RIPPLE_LIFE = 18
+RIPPLE_MAX = 8  # найбільший радіус кола на воді
+
+
+def _ring(radius):
+    """Зсуви пікселів сплющеного кола (калюжа видна згори під кутом)."""
+    t = np.linspace(0, 2 * np.pi, 8 * radius, endpoint=False)
+    offsets = np.unique(np.stack([np.rint(radius * np.cos(t)), np.rint(radius * 0.4 * np.sin(t))], axis=1), axis=0)
+    return offsets[:, 0].astype(np.int32), offsets[:, 1].astype(np.int32)
+
+
+RING_OFFSETS = [None] + [_ring(radius) for radius in range(1, RIPPLE_MAX + 1)]
+
+
+class Splashes:
+    """
+    Пул бризок і кіл на воді фіксованої місткості: лише попередньо виділені масиви, без об'єкта
+    на частинку. Нові частинки пишуться по колу (кільцевий буфер), оновлення — кілька операцій
+    над усім пулом, малювання — запис пікселів у буфер surfarray.
+    x — у координатах світу (калюжі прокручуються), y — на екрані; life == 0 — слот вільний.
+    kind: 0 — бризка (піксель, що летить по параболі), 1 — коло, що розходиться.
+    """
+
+    def __init__(self, capacity=SPLASH_CAPACITY):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int16)
+        self.kind = np.zeros(capacity, dtype=np.uint8)
+        self.cursor = 0
+        self.drawn_x = np.empty(0, dtype=np.int32)
+        self.drawn_y = np.empty(0, dtype=np.int32)
+
+    def emit(self, x, y):
+        """Бризки й коло для кожного приземлення (x — у координатах світу)."""
+        k = x.size
+        if not k:
+            return
+        kind = np.repeat(np.array([0] * SPLASH_DROPLETS + [1], dtype=np.uint8)[None, :], k, axis=0).ravel()
+        xs = np.repeat(x, SPLASH_DROPLETS + 1)
+        ys = np.repeat(y, SPLASH_DROPLETS + 1)
+        total = kind.size
+        if total > self.capacity:
+            kind, xs, ys = kind[-self.capacity:], xs[-self.capacity:], ys[-self.capacity:]
+            total = self.capacity
+        idx = (self.cursor + np.arange(total)) % self.capacity
+        self.cursor = int(idx[-1] + 1) % self.capacity
+
+        droplet = kind == 0
+        self.kind[idx] = kind
+        self.x[idx] = xs
+        self.y[idx] = ys
+        self.vx[idx] = np.where(droplet, rng.uniform(-1.5, 1.5, total), 0)
+        self.vy[idx] = np.where(droplet, rng.uniform(-3.0, -1.5, total), 0)
+        self.life[idx] = np.where(droplet, rng.integers(8, 15, total), RIPPLE_LIFE)
+
+    def update(self):
+        alive = self.life > 0
+        self.x += self.vx
+        self.y += self.vy
+        self.vy += np.where(self.kind == 0, SPLASH_GRAVITY, 0).astype(np.float32)
+        self.life -= alive
+
+    def draw(self, pixels, camera_x):
+        width, height = pixels.shape[:2]
+        alive = self.life > 0
+
+        droplets = np.flatnonzero(alive & (self.kind == 0))
+        px, py = self._clip(self.x[droplets].astype(np.int32) - camera_x,
+                            self.y[droplets].astype(np.int32), width, height)
+        pixels[px, py] = RAIN_COLOR
+
+        ripples = np.flatnonzero(alive & (self.kind == 1))
+        radius = (RIPPLE_LIFE - self.life[ripples]) * RIPPLE_MAX // RIPPLE_LIFE + 1
+        rx = self.x[ripples].astype(np.int32) - camera_x
+        ry = self.y[ripples].astype(np.int32)
+        ring_x, ring_y = [], []
+        for r in np.unique(radius).tolist():
+            same = radius == r
+            dx, dy = RING_OFFSETS[min(r, RIPPLE_MAX)]
+            ring_x.append((rx[same][:, None] + dx).ravel())
+            ring_y.append((ry[same][:, None] + dy).ravel())
+        if ring_x:
+            qx, qy = self._clip(np.concatenate(ring_x), np.concatenate(ring_y), width, height)
+            pixels[qx, qy] = RIPPLE_COLOR
+            px, py = np.concatenate([px, qx]), np.concatenate([py, qy])
+        self.drawn_x, self.drawn_y = px, py
+
+    @staticmethod
+    def _clip(xs, ys, width, height):
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        return xs[inside], ys[inside]
+
+    def erase(self, pixels, background):
+        pixels[self.drawn_x, self.drawn_y] = background[self.drawn_x, self.drawn_y]
+
 
 # --- Стежка ---
 PATH_HEIGHT = 100
-path_rect = pygame.Rect(0, HEIGHT - PATH_HEIGHT, WIDTH, PATH_HEIGHT)
-ground_rect = pygame.Rect(0, HEIGHT - 50, WIDTH, 50)
-
-# --- Калюжі ---
-puddles = []
-for _ in range(12):  # більше калюж
-    w = random.randint(80, 150)
-    h = random.randint(30, 60)
-    x = random.randint(0, WIDTH - w)
-    y = random.randint(HEIGHT - PATH_HEIGHT + 20, HEIGHT - 30)
-    puddles.append(pygame.Rect(x, y, w, h))
+path_top = HEIGHT - PATH_HEIGHT
+ground_top = HEIGHT - 50
+
+# --- Світ зі шматків ---
+# Стежка нескінченна по горизонталі: світ ділиться на шматки по CHUNK_W пікселів,
+# кожен шматок зі своїми зірками й калюжами генерується з (насіння, номер шматка),
+# тож той самий шматок після повернення виглядає так само.
+CHUNK_W = 400
+STARS_PER_CHUNK = NUM_STARS * CHUNK_W // WIDTH
+PUDDLES_PER_CHUNK = 12 * CHUNK_W // WIDTH  # як раніше: 12 калюж на екран
+INDEX_CELL = 50  # ширина комірки просторового індексу калюж
+# смуга, у яку малюються калюжі шматка (калюжі можуть трохи вилазити за нижній край екрана)
+STRIP_TOP = path_top
+STRIP_H = PATH_HEIGHT + 30
+
+# відображення зірки — круг радіуса 1
+_rdx, _rdy = np.mgrid[-1:2, -1:2]
+_rdisc = _rdx * _rdx + _rdy * _rdy <= 1
+REFLECTION_DX, REFLECTION_DY = _rdx[_rdisc], _rdy[_rdisc]
+
+
+class Chunk:
+    """
+    Шматок світу [x0, x0 + CHUNK_W): зірки, калюжі, поверхня смуги з калюжами та відображеннями
+    і просторовий індекс калюж (комірка по x -> номери калюж, що її перекривають).
+    Зірки й калюжі в шматку нерухомі, тож пікселі відображень рахуються один раз;
+    щокадру перефарбовуються лише вони.
+    """
+
+    def __init__(self, index, seed, stars_per_chunk=STARS_PER_CHUNK):
+        # від'ємні номери шматків теж мають своє насіння
+        rng = np.random.default_rng([seed, 2 * index if index >= 0 else -2 * index - 1])
+        self.index = index
+        self.x0 = index * CHUNK_W
+        self.stars = Stars(stars_per_chunk, CHUNK_W, rng)
+
+        self.puddles = []  # у координатах шматка
+        for _ in range(PUDDLES_PER_CHUNK):
+            w = int(rng.integers(80, 151))
+            h = int(rng.integers(30, 61))
+            x = int(rng.integers(0, CHUNK_W - w + 1))
+            y = int(rng.integers(HEIGHT - PATH_HEIGHT + 20, HEIGHT - 30 + 1))
+            self.puddles.append(pygame.Rect(x, y, w, h))
+        # (left, top, right, bottom) усіх калюж — для пакетної перевірки приземлень крапель
+        self.rects = np.array([(p.left, p.top, p.right, p.bottom) for p in self.puddles], dtype=np.int32)
+
+        self.cells = [[] for _ in range(CHUNK_W // INDEX_CELL)]
+        for i, puddle in enumerate(self.puddles):
+            for cell in range(puddle.left // INDEX_CELL, (puddle.right - 1) // INDEX_CELL + 1):
+                self.cells[cell].append(i)
+
+        self._render()
+
+    def _render(self):
+        self.surface = pygame.Surface((CHUNK_W, STRIP_H), pygame.SRCALPHA)
+        # мітки калюж: яка калюжа намальована в пікселі останньою (0 — жодна)
+        labels = pygame.Surface((CHUNK_W, STRIP_H))
+        labels.fill((0, 0, 0))
+        for i, puddle in enumerate(self.puddles):
+            local = puddle.move(0, -STRIP_TOP)
+            pygame.draw.ellipse(self.surface, PUDDLE_COLOR, local)
+            pygame.draw.ellipse(labels, (i + 1, 0, 0), local)
+        label = pygame.surfarray.array3d(labels)[:, :, 0]
+
+        stars = self.stars
+        mirrored = HEIGHT - stars.y
+        star_idx, px, py = [], [], []
+        for i, puddle in enumerate(self.puddles):
+            hit = np.flatnonzero((puddle.top < mirrored) & (mirrored < puddle.bottom)
+                                 & (puddle.left < stars.x) & (stars.x < puddle.right))
+            # puddle_y = top + h - (HEIGHT - sy - top), у координатах смуги
+            xs = stars.x[hit][:, None] + REFLECTION_DX
+            ys = (puddle.bottom - (mirrored[hit] - puddle.top) - STRIP_TOP)[:, None] + REFLECTION_DY
+            inside = (xs >= 0) & (xs < CHUNK_W) & (ys >= 0) & (ys < STRIP_H)
+            xs, ys = xs[inside], ys[inside]
+            # пізніша калюжа, намальована поверх, ховає відображення
+            visible = label[xs, ys] <= i + 1
+            star_idx.append(np.broadcast_to(hit[:, None], inside.shape)[inside][visible])
+            px.append(xs[visible])
+            py.append(ys[visible])
+        self.star = np.concatenate(star_idx) if star_idx else np.empty(0, dtype=np.int64)
+        self.px = np.concatenate(px) if px else np.empty(0, dtype=np.int64)
+        self.py = np.concatenate(py) if py else np.empty(0, dtype=np.int64)
+        if self.star.size:
+            # відображення видно й поза еліпсом (у кутах прямокутника)
+            alpha = pygame.surfarray.pixels_alpha(self.surface)
+            alpha[self.px, self.py] = 255
+            del alpha
+
+    def update(self):
+        """Крок мерехтіння зірок шматка і перефарбування пікселів їхніх відображень."""
+        self.stars.twinkle()
+        if self.star.size:
+            pixels = pygame.surfarray.pixels3d(self.surface)
+            pixels[self.px, self.py] = (self.stars.brightness[self.star] // 2).astype(np.uint8)[:, None]
+            del pixels
+
+    def puddles_at(self, local_x):
+        """Калюжі, що перекривають колонку local_x (у координатах шматка)."""
+        return [self.puddles[i] for i in self.cells[local_x // INDEX_CELL]]
+
+
+class World:
+    """
+    Завантажені шматки навколо камери: видимі плюс по одному з кожного боку.
+    Решта викидається, тож пам'ять і робота за кадр не залежать від того, як далеко зайшов Фриск.
+    """
+
+    def __init__(self, seed=None, num_stars=NUM_STARS):
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy % 2**63)
+        self.stars_per_chunk = num_stars * CHUNK_W // WIDTH
+        self.chunks = {}
+
+    def visible(self, camera_x, width):
+        first = camera_x // CHUNK_W - 1
+        last = (camera_x + width) // CHUNK_W + 1
+        for index in range(first, last + 1):
+            if index not in self.chunks:
+                self.chunks[index] = Chunk(index, self.seed, self.stars_per_chunk)
+        for index in [i for i in self.chunks if not first <= i <= last]:
+            del self.chunks[index]
+        return [self.chunks[index] for index in range(first, last + 1)]
+
+    def hit_test(self, chunks, camera_x):
+        """
+        Функція (x, y) -> масив bool для Rain.update: чи потрапляє точка на екрані в прямокутник
+        якоїсь калюжі з chunks. Усі точки проти всіх видимих калюж — однією операцією.
+        """
+        rects = np.concatenate([chunk.rects + (chunk.x0 - camera_x, 0, chunk.x0 - camera_x, 0)
+                                for chunk in chunks])
+
+        def test(x, y):
+            x, y = x[:, None], y[:, None]
+            return ((rects[:, 0] < x) & (x < rects[:, 2]) & (rects[:, 1] < y) & (y < rects[:, 3])).any(axis=1)
+
+        return test
+
+    def puddles_at(self, world_x):
+        """Калюжі (у координатах світу), що перекривають колонку world_x — через індекс шматка."""
+        chunk = self.chunks.get(world_x // CHUNK_W)
+        if chunk is None:
+            return []
+        return [puddle.move(chunk.x0, 0) for puddle in chunk.puddles_at(world_x - chunk.x0)]
+
 
 # --- Фриск ---
 FRISK_SIZE = 30
-frisk_pos = [WIDTH // 2, HEIGHT - PATH_HEIGHT + 30]
 FRISK_SPEED = 5
 
-running = True
-while running:
-    clock.tick(FPS)
-    screen.fill(SKY_COLOR)
-
-    # --- Зірки ---
-    for star in stars:
-        x, y, brightness, direction = star
-        pygame.draw.circle(screen, (brightness, brightness, brightness), (x, y), 2)
-        brightness += direction * 2
-        if brightness > 255:
-            brightness = 255
-            star[3] = -1
-        elif brightness < 150:
-            brightness = 150
-            star[3] = 1
-        star[2] = brightness
-
-    # --- Обрив під стежкою ---
-    pygame.draw.rect(screen, GROUND_COLOR, ground_rect)
-
-    # --- Стежка ---
-    pygame.draw.rect(screen, PATH_COLOR, path_rect)
-
-    # --- Калюжі з відображенням зірок і Фріска ---
-    for puddle in puddles:
-        pygame.draw.ellipse(screen, PUDDLE_COLOR, puddle)
-        # Відображення зірок
-        for star in stars:
-            sx, sy, b, _ = star
-            if puddle.top < HEIGHT - sy < puddle.bottom and puddle.left < sx < puddle.right:
-                puddle_y = puddle.top + (puddle.bottom - puddle.top) - (HEIGHT - sy - puddle.top)
-                pygame.draw.circle(screen, (b//2, b//2, b//2), (sx, puddle_y), 1)
-        # Відображення Фріска
+
+class Background:
+    """
+    Статичний шар: небо, обрив і стежка, намальовані один раз у поверхню.
+    Вони однакові по всій ширині, тож прокрутка кешу не чіпає — він перебудовується
+    лише тоді, коли змінився розмір вікна. array / array2d — копії пікселів (array3d / array2d)
+    для стирання бризок і крапель дощу.
+    """
+
+    def __init__(self):
+        self.size = None
+        self.surface = None
+        self.array = None
+        self.array2d = None
+
+    def get(self, size):
+        """Повертає True, якщо шар щойно перебудовано (тоді екран треба залити ним повністю)."""
+        if size == self.size:
+            return False
+        self.size = size
+        width = size[0]
+        self.surface = pygame.Surface(size).convert()
+        self.surface.fill(SKY_COLOR)
+        pygame.draw.rect(self.surface, GROUND_COLOR, (0, ground_top, width, 50))
+        pygame.draw.rect(self.surface, PATH_COLOR, (0, path_top, width, PATH_HEIGHT))
+        self.array = pygame.surfarray.array3d(self.surface)
+        self.array2d = pygame.surfarray.array2d(self.surface)
+        return True
+
+
+def main(num_drops=NUM_RAINDROPS, num_stars=NUM_STARS, seed=None):
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+    pygame.display.set_caption("Frisk on the Dark Path")
+    clock = pygame.time.Clock()
+    background = Background()
+    rain_color = screen.map_rgb(RAIN_COLOR)
+    dirty = []  # прямокутники динамічних шарів минулого кадру: їх відновлюємо з фону
+
+    world = World(seed, num_stars)
+    rain = Rain(num_drops)
+    splashes = Splashes()
+    frisk_pos = [WIDTH // 2, HEIGHT - PATH_HEIGHT + 30]  # x — у координатах світу
+    last_camera_x = None
+
+    running = True
+    while running:
+        clock.tick(FPS)
+        width = screen.get_width()
+        camera_x = frisk_pos[0] + FRISK_SIZE // 2 - width // 2
+        chunks = world.visible(camera_x, width)
+
+        # --- Статичний фон: повністю після зміни розміру чи зсуву камери, інакше стираємо тільки брудне ---
+        if background.get(screen.get_size()) or camera_x != last_camera_x:
+            screen.blit(background.surface, (0, 0))
+            rain.drawn = None
+            splashes.drawn_x = splashes.drawn_y = np.empty(0, dtype=np.int32)
+        else:
+            for rect in dirty:
+                screen.blit(background.surface, rect, rect)
+        dirty = []
+        last_camera_x = camera_x
+
+        # --- Зірки (поверх місць, де минулого кадру був дощ) ---
+        pixels = pygame.surfarray.pixels2d(screen)
+        rain.erase(pixels, background.array2d)
+        del pixels
+        pixels = pygame.surfarray.pixels3d(screen)
+        splashes.erase(pixels, background.array)
+        for chunk in chunks:
+            chunk.stars.draw(pixels, chunk.x0 - camera_x)
+        del pixels  # знімаємо блокування поверхні перед blit
+
+        # --- Калюжі з відображенням зірок ---
+        for chunk in chunks:
+            chunk.update()
+            screen.blit(chunk.surface, (chunk.x0 - camera_x, STRIP_TOP))
+
+        # --- Відображення Фріска: лише калюжі з комірки під ним ---
         fx, fy = frisk_pos
-        if puddle.left < fx + FRISK_SIZE//2 < puddle.right:
-            if puddle.top < fy + FRISK_SIZE < puddle.bottom:
-                puddle_y = puddle.top + (puddle.bottom - puddle.top) - (fy + FRISK_SIZE - puddle.top)
-                pygame.draw.rect(screen, FRISK_REFLECTION_COLOR, (fx, puddle_y - FRISK_SIZE, FRISK_SIZE, FRISK_SIZE))
-
-    # --- Дощ ---
-    for drop in raindrops:
-        x, y, length, speed = drop
-        pygame.draw.line(screen, RAIN_COLOR, (x, y), (x, y + length))
-        drop[1] += speed
-        if drop[1] > HEIGHT:
-            drop[0] = random.randint(0, WIDTH)
-            drop[1] = random.randint(-50, -10)
-            drop[2] = random.randint(10, 20)
-            drop[3] = random.uniform(4, 8)
-
-    # --- Фриск ---
-    pygame.draw.rect(screen, FRISK_COLOR, (frisk_pos[0], frisk_pos[1], FRISK_SIZE, FRISK_SIZE))
-
-    # --- Рух героя ---
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_LEFT] and frisk_pos[0] > 0:
-        frisk_pos[0] -= FRISK_SPEED
-    if keys[pygame.K_RIGHT] and frisk_pos[0] < WIDTH - FRISK_SIZE:
-        frisk_pos[0] += FRISK_SPEED
-    if keys[pygame.K_UP] and frisk_pos[1] > HEIGHT - PATH_HEIGHT - FRISK_SIZE//2:
-        frisk_pos[1] -= FRISK_SPEED
-    if keys[pygame.K_DOWN] and frisk_pos[1] < HEIGHT - FRISK_SIZE:
-        frisk_pos[1] += FRISK_SPEED
-
-    pygame.display.flip()
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-pygame.quit()
+        for puddle in world.puddles_at(fx + FRISK_SIZE//2):
+            if puddle.left < fx + FRISK_SIZE//2 < puddle.right:
+                if puddle.top < fy + FRISK_SIZE < puddle.bottom:
+                    puddle_y = puddle.top + (puddle.bottom - puddle.top) - (fy + FRISK_SIZE - puddle.top)
+                    dirty.append(pygame.draw.rect(screen, FRISK_REFLECTION_COLOR,
+                                                  (fx - camera_x, puddle_y - FRISK_SIZE, FRISK_SIZE, FRISK_SIZE)))
+
+        # --- Бризки й дощ ---
+        pixels = pygame.surfarray.pixels3d(screen)
+        splashes.draw(pixels, camera_x)
+        del pixels
+        pixels = pygame.surfarray.pixels2d(screen)
+        rain.draw(pixels, rain_color)
+        del pixels
+        land_x, land_y = rain.update(width, world.hit_test(chunks, camera_x))
+        splashes.update()
+        splashes.emit(land_x + camera_x, land_y)
+
+        # --- Фриск ---
+        dirty.append(pygame.draw.rect(screen, FRISK_COLOR, (fx - camera_x, fy, FRISK_SIZE, FRISK_SIZE)))
+
+        # --- Рух героя (по горизонталі — без меж, камера йде слідом) ---
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_LEFT]:
+            frisk_pos[0] -= FRISK_SPEED
+        if keys[pygame.K_RIGHT]:
+            frisk_pos[0] += FRISK_SPEED
+        if keys[pygame.K_UP] and frisk_pos[1] > HEIGHT - PATH_HEIGHT - FRISK_SIZE//2:
+            frisk_pos[1] -= FRISK_SPEED
+        if keys[pygame.K_DOWN] and frisk_pos[1] < HEIGHT - FRISK_SIZE:
+            frisk_pos[1] += FRISK_SPEED
+
+        pygame.display.flip()
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.VIDEORESIZE:
+                # новий розмір — фон перебудується на наступному кадрі
+                screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
+                rain_color = screen.map_rgb(RAIN_COLOR)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Frisk on the Dark Path")
+    parser.add_argument("--drops", type=int, default=NUM_RAINDROPS, help="кількість крапель (напр. 100000)")
+    parser.add_argument("--stars", type=int, default=NUM_STARS, help="зірок на ширину екрана")
+    parser.add_argument("--seed", type=int, default=None, help="насіння світу")
+    args = parser.parse_args()
+    main(args.drops, args.stars, args.seed)
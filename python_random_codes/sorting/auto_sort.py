@@ -0,0 +1,64 @@
+from hybrid_sort import hybrid_sort
+from radix_sort import RADIX_BITS, _counting_sort, _radix_sort_lsd
+
+# Приблизна вартість операцій у «кроках» інтерпретатора (один крок — запис елемента, ~100 нс).
+# Підібрано за вимірами _counting_sort, _radix_sort_lsd і hybrid_sort на n = 30..200 000
+# і діапазонах 4..2^40 (перевірка — benchmark.py --algorithms counting_sort radix_sort_lsd auto_sort).
+# Порівняння об'єктів у Python-сортуванні дорожче за розкладання по кошиках
+COMPARISON_COST = 2.0
+BUCKET_COST = 1.0
+# прохід LSD: розкласти індекси по кошиках, прочитавши ключ, і зібрати кошики назад у список
+RADIX_PASS_COST = 3.0
+
+
+def choose_algorithm(keys):
+    """
+    Обирає алгоритм за простою моделлю вартості:
+    - counting: 2n (підрахунок і розкладання) + діапазон ключів
+    - radix (LSD): 2n (зсув ключів і фінальне збирання) + проходи * (3n + 2^RADIX_BITS)
+    - comparison (hybrid_sort): n * log2(n) порівнянь
+    Повертає "counting", "radix" або "comparison".
+    """
+    n = len(keys)
+    if n < 2 or not all(isinstance(k, int) for k in keys):
+        return "comparison"
+    span = max(keys) - min(keys) + 1
+    passes = max(1, -(-(span - 1).bit_length() // RADIX_BITS))
+    costs = {
+        "counting": BUCKET_COST * (2 * n + span),
+        "radix": BUCKET_COST * (2 * n + passes * (RADIX_PASS_COST * n + (1 << RADIX_BITS))),
+        "comparison": COMPARISON_COST * n * max(1, n.bit_length() - 1),
+    }
+    return min(costs, key=costs.get)
+
+
+def auto_sort(arr, key=None):
+    """
+    Стабільно сортує arr на місці, обираючи найдешевший алгоритм:
+    для цілих ключів у вузькому діапазоні — підрахунок або порозрядне сортування,
+    інакше — hybrid_sort. Повертає назву обраного алгоритму.
+    """
+    keys = list(arr) if key is None else [key(x) for x in arr]
+    algorithm = choose_algorithm(keys)
+    if algorithm == "counting":
+        _counting_sort(arr, keys)
+    elif algorithm == "radix":
+        _radix_sort_lsd(arr, keys)
+    elif key is None:
+        hybrid_sort(arr)
+    else:
+        # ключ рахуємо один раз; індекс зберігає стабільність і не дає порівнювати самі елементи
+        decorated = [(k, i) for i, k in enumerate(keys)]
+        hybrid_sort(decorated)
+        arr[:] = [arr[i] for _, i in decorated]
+    return algorithm
+
+
+if __name__ == "__main__":
+    import random
+
+    for data in ([random.randint(0, 100) for _ in range(1000)],
+                 [random.randint(-2**40, 2**40) for _ in range(100_000)],
+                 [random.random() for _ in range(1000)]):
+        expected = sorted(data)
+        print(auto_sort(data), data == expected)
@@ -0,0 +1,231 @@
+# benchmark.py
+# Порівняльний бенчмарк алгоритмів сортування з цієї папки.
+# Запуск:  python benchmark.py --sizes 10 100 1000 --out results
+#          python benchmark.py --compare results/old.json results/new.json
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from bubble_sort import bubble_sort
+from insertion_sort import insertion_sort
+from selection_sort import selection_sort
+from quick_sort import quick_sort, introsort
+from hybrid_sort import hybrid_sort
+from radix_sort import counting_sort, radix_sort_lsd, radix_sort_msd
+from auto_sort import auto_sort
+import instrumented
+
+# назва -> (функція, квадратичний алгоритм?)
+ALGORITHMS = {
+    "bubble_sort": (bubble_sort, True),
+    "insertion_sort": (insertion_sort, True),
+    "selection_sort": (selection_sort, True),
+    "quick_sort": (quick_sort, False),
+    "introsort": (introsort, False),
+    "hybrid_sort": (hybrid_sort, False),
+    "counting_sort": (counting_sort, False),
+    "radix_sort_lsd": (radix_sort_lsd, False),
+    "radix_sort_msd": (radix_sort_msd, False),
+    "auto_sort": (auto_sort, False),
+}
+
+DEFAULT_SIZES = [10, 100, 1000, 10_000, 100_000, 1_000_000]
+SHAPES = ["random", "sorted", "reversed", "duplicates", "nearly_sorted"]
+
+# квадратичні алгоритми на 10^6 елементів працюють годинами
+DEFAULT_MAX_QUADRATIC = 10_000
+
+FIELDS = ["algorithm", "shape", "n", "time_s", "comparisons", "swaps", "moves", "max_depth", "allocations",
+          "peak_bytes", "ok", "error"]
+
+
+# --- Вхідні дані ---
+def make_data(shape, n, seed=0):
+    """Генерує список цілих чисел потрібної форми (детерміновано за seed)."""
+    rnd = random.Random(f"{seed}-{shape}-{n}")
+    if shape == "random":
+        return [rnd.randint(0, n * 10) for _ in range(n)]
+    if shape == "sorted":
+        return list(range(n))
+    if shape == "reversed":
+        return list(range(n, 0, -1))
+    if shape == "duplicates":
+        return [rnd.randint(0, 9) for _ in range(n)]
+    if shape == "nearly_sorted":
+        data = list(range(n))
+        # переставляємо ~1% пар
+        for _ in range(max(1, n // 100)):
+            i = rnd.randrange(n)
+            j = rnd.randrange(n)
+            data[i], data[j] = data[j], data[i]
+        return data
+    raise ValueError(f"невідома форма даних: {shape}")
+
+
+# --- Заміри ---
+def run_sort(fn, data):
+    """Сортує data; підтримує як сортування на місці, так і функції, що повертають новий список."""
+    result = fn(data)
+    return result if isinstance(result, list) else data
+
+
+def measure(fn, data, repeat=1, counts=True, memory=True, instrumented_fn=None):
+    """
+    Час (найкращий з repeat), коректність і пік пам'яті fn на data.
+    Лічильники (порівняння, обміни, ...) дає instrumented_fn — інструментований варіант
+    того самого алгоритму; без нього вони лишаються None.
+    """
+    row = {"time_s": None, "comparisons": None, "swaps": None, "moves": None, "max_depth": None,
+           "allocations": None, "peak_bytes": None, "ok": False, "error": ""}
+    expected = sorted(data)
+    try:
+        best = None
+        for _ in range(repeat):
+            work = list(data)
+            t0 = time.perf_counter()
+            result = run_sort(fn, work)
+            elapsed = time.perf_counter() - t0
+            best = elapsed if best is None else min(best, elapsed)
+        row["time_s"] = best
+        row["ok"] = list(result) == expected
+
+        if memory:
+            work = list(data)
+            tracemalloc.start()
+            run_sort(fn, work)
+            row["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        if counts and instrumented_fn is not None:
+            row.update(instrumented_fn(list(data)).as_dict())
+            del row["passes"]
+    except RecursionError as e:
+        row["error"] = f"RecursionError: {e}"
+    finally:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+    return row
+
+
+def run_benchmark(algorithms, sizes, shapes, repeat=1, max_quadratic=DEFAULT_MAX_QUADRATIC,
+                  counts=True, memory=True, seed=0, verbose=True):
+    rows = []
+    for name in algorithms:
+        fn, quadratic = ALGORITHMS[name]
+        counter = None
+        if counts:
+            # лічильники беруться лише з інструментованих варіантів — без нього рахувати нічим
+            counter = instrumented.ALGORITHMS.get(name)
+            if counter is None:
+                raise KeyError(f"немає інструментованого варіанта {name!r} в instrumented.ALGORITHMS "
+                               f"(додайте його або запускайте з --no-counts)")
+        for shape in shapes:
+            for n in sizes:
+                if quadratic and n > max_quadratic:
+                    continue
+                data = make_data(shape, n, seed)
+                row = {"algorithm": name, "shape": shape, "n": n}
+                row.update(measure(fn, data, repeat, counts, memory, counter))
+                rows.append(row)
+                if verbose:
+                    t = "-" if row["time_s"] is None else f"{row['time_s']:.6f}s"
+                    print(f"{name:16} {shape:14} n={n:<9} {t:>12}  cmp={row['comparisons']}  swaps={row['swaps']}  "
+                          f"moves={row['moves']}  peak={row['peak_bytes']}  {row['error']}")
+    return rows
+
+
+# --- Збереження результатів ---
+def save_results(rows, out_dir, label=None):
+    """Записує результати у JSON (з метаданими) та CSV. Повертає шляхи до файлів."""
+    os.makedirs(out_dir, exist_ok=True)
+    label = label or datetime.now().strftime("%Y%m%d-%H%M%S")
+    meta = {
+        "label": label,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+    }
+    json_path = os.path.join(out_dir, f"bench-{label}.json")
+    csv_path = os.path.join(out_dir, f"bench-{label}.csv")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": rows}, f, indent=1)
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: row.get(k) for k in FIELDS})
+    return json_path, csv_path
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare_results(old_rows, new_rows, threshold=1.2):
+    """
+    Порівнює два прогони. Регресія — якщо час зріс більше ніж у threshold разів,
+    кількість порівнянь зросла, або результат перестав бути правильним.
+    Повертає список рядків-описів регресій.
+    """
+    key = lambda r: (r["algorithm"], r["shape"], r["n"])
+    old = {key(r): r for r in old_rows}
+    regressions = []
+    for r in new_rows:
+        o = old.get(key(r))
+        if o is None:
+            continue
+        name = "{} {} n={}".format(*key(r))
+        if o["ok"] and not r["ok"]:
+            regressions.append(f"{name}: результат неправильний ({r['error'] or 'wrong order'})")
+            continue
+        if o["time_s"] and r["time_s"] and r["time_s"] > o["time_s"] * threshold:
+            regressions.append(f"{name}: час {o['time_s']:.6f}s -> {r['time_s']:.6f}s")
+        if o["comparisons"] is not None and r["comparisons"] is not None and r["comparisons"] > o["comparisons"]:
+            regressions.append(f"{name}: порівнянь {o['comparisons']} -> {r['comparisons']}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк алгоритмів сортування")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--shapes", nargs="+", default=SHAPES, choices=SHAPES)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--max-quadratic", type=int, default=DEFAULT_MAX_QUADRATIC,
+                        help="максимальний розмір для O(n^2) алгоритмів")
+    parser.add_argument("--no-counts", action="store_true", help="не рахувати порівняння/переміщення")
+    parser.add_argument("--no-memory", action="store_true", help="не вимірювати пікову пам'ять")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bench_results", help="папка для JSON/CSV")
+    parser.add_argument("--label", default=None)
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="порівняти два JSON-файли замість запуску")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        regressions = compare_results(load_results(args.compare[0]), load_results(args.compare[1]), args.threshold)
+        for line in regressions:
+            print("РЕГРЕСІЯ:", line)
+        if not regressions:
+            print("Регресій не знайдено")
+        return 1 if regressions else 0
+
+    rows = run_benchmark(args.algorithms, args.sizes, args.shapes, args.repeat, args.max_quadratic,
+                         counts=not args.no_counts, memory=not args.no_memory, seed=args.seed)
+    json_path, csv_path = save_results(rows, args.out, args.label)
+    print("Збережено:", json_path, csv_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,29 @@
-def bubble_sort(arr):
+def bubble_sort(arr, key=None, reverse=False):
+    """
+    Сортування бульбашкою на місці. Стабільне.
+    key рахується один раз для кожного елемента (паралельний масив ключів);
+    reverse=True зберігає стабільність, як у sorted().
+    """
+    if key is None and not reverse:
+        for i in range(len(arr) - 1):
+            for j in range(len(arr) - 1 - i):
+                if arr[j] > arr[j + 1]:
+                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
+        return
+
+    # reverse = розвернути, стабільно відсортувати, розвернути
+    if reverse:
+        arr.reverse()
+    keys = list(arr) if key is None else [key(x) for x in arr]
     for i in range(len(arr) - 1):
         for j in range(len(arr) - 1 - i):
-            if arr[j] > arr[j + 1]:
+            if keys[j] > keys[j + 1]:
+                keys[j], keys[j + 1] = keys[j + 1], keys[j]
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
+    if reverse:
+        arr.reverse()
 
-numbers = [5, 3, 8, 4, 2]
-bubble_sort(numbers)
-print("Відсортований список:", numbers)
+if __name__ == "__main__":
+    numbers = [5, 3, 8, 4, 2]
+    bubble_sort(numbers)
+    print("Відсортований список:", numbers)
@@ -0,0 +1,172 @@
+# external_sort.py
+# Зовнішнє сортування файлів, більших за оперативну пам'ять.
+# Запуск:  python external_sort.py input.txt output.txt --memory 64M
+#          python external_sort.py input.bin output.bin --record-size 16 --key-offset 0 --key-length 8
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+
+from hybrid_sort import hybrid_sort
+
+# Приблизні накладні витрати на один рядок/запис у пам'яті (об'єкт bytes + слот у списку)
+ITEM_OVERHEAD = 64
+# Скільки серій зливаємо за один прохід; більше — зливаємо в кілька проходів
+MAX_FAN_IN = 64
+MIN_BUFFER = 64 * 1024
+
+
+def external_sort_lines(in_path, out_path, memory=64 << 20, tmp_dir=None):
+    """
+    Сортує текстовий файл з рядками, розділеними \\n (порівняння побайтове).
+    Рядки читаються й порівнюються без \\n у кінці (інакше рядок з байтом, меншим за \\n,
+    напр. \\t, опинявся б після власного префікса), а \\n дописується під час запису.
+    """
+    with open(in_path, "rb") as f:
+        runs = _write_runs(_iter_lines(f), memory, tmp_dir, None, b"\n")
+    _merge_to_output(runs, out_path, memory, _iter_lines, None, b"\n")
+
+
+def external_sort_records(in_path, out_path, record_size, memory=64 << 20, tmp_dir=None,
+                          key_offset=0, key_length=None):
+    """
+    Сортує файл записів фіксованої довжини record_size байт.
+    Ключ — байти record[key_offset:key_offset + key_length] (за замовчуванням весь запис);
+    записи з однаковим ключем упорядковуються за повним вмістом.
+    """
+    size = os.path.getsize(in_path)
+    if size % record_size:
+        raise ValueError(f"розмір файлу {size} не кратний довжині запису {record_size}")
+    key = None
+    if key_offset or key_length is not None:
+        end = record_size if key_length is None else key_offset + key_length
+        key = lambda rec: rec[key_offset:end]
+    reader = lambda f: _iter_records(f, record_size)
+    with open(in_path, "rb") as f:
+        runs = _write_runs(reader(f), memory, tmp_dir, key, b"")
+    _merge_to_output(runs, out_path, memory, reader, key, b"")
+
+
+# --- Читання ---
+def _iter_lines(f):
+    for line in f:
+        # без \n: так рядки порівнюються правильно, а останній рядок файлу без \n не відрізняється від інших
+        yield line[:-1] if line.endswith(b"\n") else line
+
+
+def _iter_records(f, record_size, batch=4096):
+    while True:
+        block = f.read(record_size * batch)
+        if not block:
+            return
+        for i in range(0, len(block), record_size):
+            yield block[i:i + record_size]
+
+
+# --- Фаза 1: відсортовані серії ---
+def _write_runs(items, memory, tmp_dir, key, sep):
+    """
+    Читає порції до memory байт, сортує кожну і записує у тимчасовий файл (кожен елемент + sep).
+    З key елемент зберігається парою (key(item), item), зібраною один раз при читанні,
+    і ключ та кортеж теж рахуються в used. Повертає шляхи.
+    """
+    runs = []
+    chunk = []
+    used = 0
+    for item in items:
+        if key is None:
+            chunk.append(item)
+            used += len(item) + ITEM_OVERHEAD
+        else:
+            k = key(item)
+            chunk.append((k, item))
+            used += len(item) + len(k) + 2 * ITEM_OVERHEAD
+        if used >= memory:
+            runs.append(_flush_run(chunk, tmp_dir, key, sep))
+            chunk = []
+            used = 0
+    if chunk or not runs:
+        runs.append(_flush_run(chunk, tmp_dir, key, sep))
+    return runs
+
+
+def _flush_run(chunk, tmp_dir, key, sep):
+    # без key=: hybrid_sort не будує ще однієї копії ключів, пари порівнюються як є
+    hybrid_sort(chunk)
+    items = chunk if key is None else (item for _, item in chunk)
+    fd, path = tempfile.mkstemp(prefix="run-", suffix=".tmp", dir=tmp_dir)
+    with os.fdopen(fd, "wb", buffering=MIN_BUFFER) as f:
+        f.writelines(items if not sep else (item + sep for item in items))
+    return path
+
+
+# --- Фаза 2: k-way злиття ---
+def _merge_to_output(runs, out_path, memory, reader, key, sep):
+    """Зливає серії купою; якщо серій більше за MAX_FAN_IN, зливає у кілька проходів."""
+    try:
+        while len(runs) > MAX_FAN_IN:
+            merged = []
+            for i in range(0, len(runs), MAX_FAN_IN):
+                group = runs[i:i + MAX_FAN_IN]
+                fd, path = tempfile.mkstemp(prefix="run-", suffix=".tmp", dir=os.path.dirname(group[0]))
+                os.close(fd)
+                _merge_files(group, path, memory, reader, key, sep)
+                for p in group:
+                    os.remove(p)
+                merged.append(path)
+            runs = merged
+        _merge_files(runs, out_path, memory, reader, key, sep)
+    finally:
+        for p in runs:
+            if os.path.exists(p):
+                os.remove(p)
+
+
+def _merge_files(paths, out_path, memory, reader, key, sep):
+    # пам'ять ділимо між буферами вхідних файлів і вихідного
+    buffer = max(MIN_BUFFER, memory // (len(paths) + 1))
+    files = [open(p, "rb", buffering=buffer) for p in paths]
+    # у купі лише по одному елементу з кожної серії, тож ключ-пару тут можна будувати на льоту
+    merge_key = None if key is None else (lambda item: (key(item), item))
+    try:
+        with open(out_path, "wb", buffering=buffer) as out:
+            merged = heapq.merge(*(reader(f) for f in files), key=merge_key)
+            out.writelines(merged if not sep else (item + sep for item in merged))
+    finally:
+        for f in files:
+            f.close()
+
+
+def parse_size(text):
+    """'64M' -> 67108864; підтримує суфікси K, M, G."""
+    text = text.strip().upper()
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Зовнішнє сортування великих файлів")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--memory", default="64M", help="бюджет пам'яті, напр. 256M")
+    parser.add_argument("--tmp-dir", default=None)
+    parser.add_argument("--record-size", type=int, default=None,
+                        help="довжина бінарного запису в байтах (без неї файл читається як текст)")
+    parser.add_argument("--key-offset", type=int, default=0)
+    parser.add_argument("--key-length", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    memory = parse_size(args.memory)
+    if args.record_size:
+        external_sort_records(args.input, args.output, args.record_size, memory, args.tmp_dir,
+                              args.key_offset, args.key_length)
+    else:
+        external_sort_lines(args.input, args.output, memory, args.tmp_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+from bisect import bisect_left, bisect_right
+
+from insertion_sort import binary_insertion_sort
+
+# Після стількох перемог однієї серії поспіль переходимо в режим галопу
+MIN_GALLOP = 7
+
+
+def hybrid_sort(arr, key=None, reverse=False):
+    """
+    Адаптивне стабільне сортування на місці (у стилі timsort):
+    - знаходить готові зростаючі та спадні серії (спадні розвертає)
+    - короткі серії добудовує до minrun бінарними вставками
+    - зливає серії зі стеку, використовуючи галоп
+    Майже відсортовані дані — близько O(n), випадкові — O(n log n).
+    З key сортуються пари (ключ, початковий індекс) — ключ рахується один раз.
+    """
+    if key is None and not reverse:
+        _hybrid_sort(arr)
+        return
+
+    # reverse = розвернути, стабільно відсортувати, розвернути
+    if reverse:
+        arr.reverse()
+    if key is None:
+        _hybrid_sort(arr)
+    else:
+        decorated = [(key(x), i) for i, x in enumerate(arr)]
+        _hybrid_sort(decorated)
+        arr[:] = [arr[i] for _, i in decorated]
+    if reverse:
+        arr.reverse()
+
+
+def _hybrid_sort(arr, state=None):
+    n = len(arr)
+    if n < 2:
+        return
+    min_run = _min_run_length(n)
+    state = state or _MergeState()
+
+    lo = 0
+    while lo < n:
+        run_end = _count_run_and_make_ascending(arr, lo, n)
+        # коротку серію добудовуємо вставками
+        if run_end - lo < min_run:
+            forced = min(lo + min_run, n)
+            binary_insertion_sort(arr, lo, forced, run_end)
+            run_end = forced
+        state.runs.append((lo, run_end - lo))
+        _merge_collapse(arr, state)
+        lo = run_end
+
+    _merge_force_collapse(arr, state)
+
+
+class _MergeState:
+    def __init__(self):
+        self.runs = []  # стек (початок, довжина)
+        self.min_gallop = MIN_GALLOP
+
+
+def _min_run_length(n):
+    # n / 2^k для 32 <= minrun <= 64, із заокругленням угору
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run_and_make_ascending(arr, lo, hi):
+    """Повертає кінець серії, що починається з lo. Строго спадну серію розвертає (стабільно)."""
+    run_end = lo + 1
+    if run_end == hi:
+        return hi
+    if arr[run_end] < arr[lo]:
+        # строго спадна
+        run_end += 1
+        while run_end < hi and arr[run_end] < arr[run_end - 1]:
+            run_end += 1
+        arr[lo:run_end] = arr[lo:run_end][::-1]
+    else:
+        # неспадна
+        run_end += 1
+        while run_end < hi and not arr[run_end] < arr[run_end - 1]:
+            run_end += 1
+    return run_end
+
+
+def _merge_collapse(arr, state):
+    runs = state.runs
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        _merge_at(arr, state, n)
+
+
+def _merge_force_collapse(arr, state):
+    runs = state.runs
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+            n -= 1
+        _merge_at(arr, state, n)
+
+
+def _merge_at(arr, state, i):
+    lo, len_a = state.runs[i]
+    mid, len_b = state.runs[i + 1]
+    hi = mid + len_b
+    state.runs[i] = (lo, len_a + len_b)
+    del state.runs[i + 1]
+
+    # початок лівої серії, що вже менший за перший елемент правої, лишається на місці
+    lo = _gallop_right(arr[mid], arr, lo, mid)
+    if lo == mid:
+        return
+    # кінець правої серії, що вже більший за останній елемент лівої, — теж
+    hi = _gallop_left(arr[mid - 1], arr, mid, hi, from_end=True)
+    if hi == mid:
+        return
+
+    if mid - lo <= hi - mid:
+        _merge_lo(arr, state, lo, mid, hi)
+    else:
+        _merge_hi(arr, state, lo, mid, hi)
+
+
+# --- Галоп: експоненційний пошук + бінарний у знайденому проміжку ---
+def _gallop_left(key, a, lo, hi, from_end=False):
+    """Як bisect_left(a, key, lo, hi), але за O(log k), де k — відстань від початку (або кінця)."""
+    if not from_end:
+        ofs = 1
+        while lo + ofs < hi and a[lo + ofs - 1] < key:
+            lo, ofs = lo + ofs, ofs * 2
+        return bisect_left(a, key, lo, min(lo + ofs, hi))
+    ofs = 1
+    while hi - ofs > lo and not a[hi - ofs] < key:
+        hi, ofs = hi - ofs, ofs * 2
+    return bisect_left(a, key, max(hi - ofs, lo), hi)
+
+
+def _gallop_right(key, a, lo, hi, from_end=False):
+    """Як bisect_right(a, key, lo, hi), але за O(log k), де k — відстань від початку (або кінця)."""
+    if not from_end:
+        ofs = 1
+        while lo + ofs < hi and not key < a[lo + ofs - 1]:
+            lo, ofs = lo + ofs, ofs * 2
+        return bisect_right(a, key, lo, min(lo + ofs, hi))
+    ofs = 1
+    while hi - ofs > lo and key < a[hi - ofs]:
+        hi, ofs = hi - ofs, ofs * 2
+    return bisect_right(a, key, max(hi - ofs, lo), hi)
+
+
+def _merge_lo(arr, state, lo, mid, hi):
+    """Злиття, коли ліва серія коротша: копіюємо її і заповнюємо arr зліва направо."""
+    tmp = arr[lo:mid]
+    i, n_tmp = 0, len(tmp)
+    j = mid
+    k = lo
+    min_gallop = state.min_gallop
+
+    while i < n_tmp and j < hi:
+        count_a = count_b = 0
+        # звичайний режим: по одному елементу
+        while i < n_tmp and j < hi:
+            if arr[j] < tmp[i]:
+                arr[k] = arr[j]
+                j += 1
+                count_b += 1
+                count_a = 0
+            else:
+                arr[k] = tmp[i]
+                i += 1
+                count_a += 1
+                count_b = 0
+            k += 1
+            if count_a >= min_gallop or count_b >= min_gallop:
+                break
+        else:
+            break
+
+        # режим галопу: переносимо цілі блоки
+        while i < n_tmp and j < hi:
+            end = _gallop_right(arr[j], tmp, i, n_tmp)
+            count_a = end - i
+            arr[k:k + count_a] = tmp[i:end]
+            k += count_a
+            i = end
+            if i == n_tmp:
+                break
+
+            end = _gallop_left(tmp[i], arr, j, hi)
+            count_b = end - j
+            arr[k:k + count_b] = arr[j:end]
+            k += count_b
+            j = end
+            if j == hi:
+                break
+
+            arr[k] = tmp[i]
+            k += 1
+            i += 1
+
+            min_gallop = max(1, min_gallop - 1)
+            if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                break
+        min_gallop += 1
+
+    # залишок правої серії вже на місці
+    arr[k:k + n_tmp - i] = tmp[i:]
+    state.min_gallop = max(1, min_gallop)
+
+
+def _merge_hi(arr, state, lo, mid, hi):
+    """Злиття, коли права серія коротша: копіюємо її і заповнюємо arr справа наліво."""
+    tmp = arr[mid:hi]
+    t = len(tmp)      # tmp[:t] ще не перенесені
+    i = mid           # arr[lo:i] з лівої серії ще не перенесені
+    k = hi            # arr[k:hi] вже заповнені
+    min_gallop = state.min_gallop
+
+    while t > 0 and i > lo:
+        count_a = count_b = 0
+        while t > 0 and i > lo:
+            k -= 1
+            if tmp[t - 1] < arr[i - 1]:
+                arr[k] = arr[i - 1]
+                i -= 1
+                count_a += 1
+                count_b = 0
+            else:
+                arr[k] = tmp[t - 1]
+                t -= 1
+                count_b += 1
+                count_a = 0
+            if count_a >= min_gallop or count_b >= min_gallop:
+                break
+        else:
+            break
+
+        while t > 0 and i > lo:
+            # елементи лівої серії, строго більші за tmp[t-1]
+            start = _gallop_right(tmp[t - 1], arr, lo, i, from_end=True)
+            count_a = i - start
+            arr[k - count_a:k] = arr[start:i]
+            k -= count_a
+            i = start
+            if i == lo:
+                break
+
+            # елементи tmp, не менші за arr[i-1]
+            start = _gallop_left(arr[i - 1], tmp, 0, t, from_end=True)
+            count_b = t - start
+            arr[k - count_b:k] = tmp[start:t]
+            k -= count_b
+            t = start
+            if t == 0:
+                break
+
+            k -= 1
+            arr[k] = arr[i - 1]
+            i -= 1
+
+            min_gallop = max(1, min_gallop - 1)
+            if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                break
+        min_gallop += 1
+
+    # залишок лівої серії вже на місці
+    arr[k - t:k] = tmp[:t]
+    state.min_gallop = max(1, min_gallop)
+
+
+if __name__ == "__main__":
+    numbers = [1, 2, 3, 9, 8, 7, 4, 5, 6, 0]
+    hybrid_sort(numbers)
+    print("Відсортований список:", numbers)
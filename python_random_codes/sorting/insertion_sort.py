@@ -1,12 +1,57 @@
-def insertion_sort(arr):
+from bisect import bisect_right
+
+def insertion_sort(arr, key=None, reverse=False):
+    """
+    Сортування вставками на місці. Стабільне.
+    key рахується один раз для кожного елемента (паралельний масив ключів);
+    reverse=True зберігає стабільність, як у sorted().
+    """
+    if key is None and not reverse:
+        for i in range(1, len(arr)):
+            x = arr[i]
+            j = i - 1
+            while j >= 0 and arr[j] > x:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = x
+        return
+
+    # reverse = розвернути, стабільно відсортувати, розвернути
+    if reverse:
+        arr.reverse()
+    keys = list(arr) if key is None else [key(x) for x in arr]
     for i in range(1, len(arr)):
-        key = arr[i]
+        x = arr[i]
+        k = keys[i]
         j = i - 1
-        while j >= 0 and arr[j] > key:
+        while j >= 0 and keys[j] > k:
             arr[j + 1] = arr[j]
+            keys[j + 1] = keys[j]
             j -= 1
-        arr[j + 1] = key
+        arr[j + 1] = x
+        keys[j + 1] = k
+    if reverse:
+        arr.reverse()
+
+
+def binary_insertion_sort(arr, lo=0, hi=None, start=None):
+    """
+    Сортування вставками з бінарним пошуком місця для вставки.
+    Сортує arr[lo:hi] на місці; arr[lo:start] вже має бути відсортованим.
+    Стабільне: однаковий елемент вставляється після вже наявних.
+    """
+    if hi is None:
+        hi = len(arr)
+    if start is None or start == lo:
+        start = lo + 1
+    for i in range(start, hi):
+        key = arr[i]
+        pos = bisect_right(arr, key, lo, i)
+        if pos != i:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = key
 
-numbers = [5, 3, 8, 4, 2]
-insertion_sort(numbers)
-print("Відсортований список:", numbers)
+if __name__ == "__main__":
+    numbers = [5, 3, 8, 4, 2]
+    insertion_sort(numbers)
+    print("Відсортований список:", numbers)
@@ -0,0 +1,507 @@
+# instrumented.py
+# Інструментовані варіанти алгоритмів сортування.
+# Звичайні функції (bubble_sort, quick_sort, ...) лишаються без жодних перевірок у циклах;
+# тут — окремі копії тих самих алгоритмів, що рахують роботу і викликають callback.
+#
+#   stats = instrumented.sort("quick_sort", data, callback=print_event)
+#   print(stats.as_dict())
+#
+# Є варіанти для всіх алгоритмів бенчмарку: квадратичних, quick_sort/introsort, hybrid_sort,
+# counting_sort, radix_sort_lsd, radix_sort_msd і auto_sort (той самий вибір шляху, що й у справжньому).
+# Не інструментовані: quickselect (не сортує), numeric_sort і parallel_sort (робота йде в C
+# або в інших процесах) та external_sort (упирається у файли, а не в порівняння).
+from auto_sort import choose_algorithm
+from quick_sort import INSERTION_CUTOFF, NINTHER_THRESHOLD
+from hybrid_sort import _MergeState, _hybrid_sort
+from radix_sort import MSD_CUTOFF, RADIX, RADIX_BITS, RADIX_MASK
+
+
+class SortStats:
+    """Лічильники роботи алгоритму."""
+    __slots__ = ("comparisons", "swaps", "moves", "depth", "max_depth", "allocations", "passes")
+
+    def __init__(self):
+        self.comparisons = 0   # порівняння елементів
+        self.swaps = 0         # обміни двох елементів
+        self.moves = 0         # окремі записи елемента (зсуви, копіювання при злитті)
+        self.depth = 0         # поточна глибина рекурсії
+        self.max_depth = 0
+        self.allocations = 0   # тимчасові буфери (копії, кошики)
+        self.passes = 0        # проходи / розбиття / злиття
+
+    def enter(self):
+        self.depth += 1
+        if self.depth > self.max_depth:
+            self.max_depth = self.depth
+
+    def leave(self):
+        self.depth -= 1
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__ if name != "depth"}
+
+    def __repr__(self):
+        return f"SortStats({self.as_dict()})"
+
+
+def _noop(event, stats, info):
+    pass
+
+
+# --- Квадратичні алгоритми ---
+def bubble_sort(arr, callback=None, stats=None):
+    """Як bubble_sort.bubble_sort; callback("pass", stats, {...}) після кожного проходу."""
+    stats = stats or SortStats()
+    callback = callback or _noop
+    n = len(arr)
+    for i in range(n - 1):
+        swaps = 0
+        for j in range(n - 1 - i):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                swaps += 1
+        stats.comparisons += n - 1 - i
+        stats.swaps += swaps
+        stats.passes += 1
+        callback("pass", stats, {"pass": i, "swaps": swaps})
+    return stats
+
+
+def insertion_sort(arr, callback=None, stats=None):
+    """Як insertion_sort.insertion_sort; callback("pass", ...) після вставки кожного елемента."""
+    stats = stats or SortStats()
+    callback = callback or _noop
+    for i in range(1, len(arr)):
+        x = arr[i]
+        j = i - 1
+        comparisons = 0
+        while j >= 0:
+            comparisons += 1
+            if not arr[j] > x:
+                break
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = x
+        stats.comparisons += comparisons
+        stats.moves += i - j
+        stats.passes += 1
+        callback("pass", stats, {"pass": i - 1, "position": j + 1})
+    return stats
+
+
+def selection_sort(arr, callback=None, stats=None):
+    """Як selection_sort.selection_sort; callback("pass", ...) після кожного проходу."""
+    stats = stats or SortStats()
+    callback = callback or _noop
+    n = len(arr)
+    for i in range(n - 1):
+        min_index = i
+        for j in range(i + 1, n):
+            if arr[j] < arr[min_index]:
+                min_index = j
+        stats.comparisons += n - 1 - i
+        if min_index != i:
+            arr[i], arr[min_index] = arr[min_index], arr[i]
+            stats.swaps += 1
+        stats.passes += 1
+        callback("pass", stats, {"pass": i, "min_index": min_index})
+    return stats
+
+
+# --- Інтросорт (quick_sort) ---
+def quick_sort(arr, callback=None, stats=None):
+    """
+    Як quick_sort.introsort (сортує на місці).
+    callback("partition", ...) після кожного розбиття, ("heapsort", ...) і ("insertion", ...)
+    при переході на запасні алгоритми.
+    """
+    stats = stats or SortStats()
+    callback = callback or _noop
+    if len(arr) > 1:
+        _introsort(arr, 0, len(arr), 2 * len(arr).bit_length(), stats, callback)
+    return stats
+
+
+def _introsort(arr, lo, hi, depth_limit, stats, callback):
+    stats.enter()
+    while hi - lo > INSERTION_CUTOFF:
+        if depth_limit == 0:
+            _heap_sort(arr, lo, hi, stats)
+            callback("heapsort", stats, {"lo": lo, "hi": hi})
+            stats.leave()
+            return
+        depth_limit -= 1
+
+        pivot = arr[_choose_pivot(arr, lo, hi, stats)]
+        lt, gt = _partition3(arr, lo, hi, pivot, stats)
+        stats.passes += 1
+        callback("partition", stats, {"lo": lo, "hi": hi, "lt": lt, "gt": gt, "depth": stats.depth})
+
+        if lt - lo < hi - gt:
+            _introsort(arr, lo, lt, depth_limit, stats, callback)
+            lo = gt
+        else:
+            _introsort(arr, gt, hi, depth_limit, stats, callback)
+            hi = lt
+    _insertion_range(arr, lo, hi, stats)
+    callback("insertion", stats, {"lo": lo, "hi": hi})
+    stats.leave()
+
+
+def _median3(arr, a, b, c, stats):
+    stats.comparisons += 2
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        stats.comparisons += 1
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    stats.comparisons += 1
+    return c if arr[b] < arr[c] else b
+
+
+def _choose_pivot(arr, lo, hi, stats):
+    n = hi - lo
+    mid = lo + n // 2
+    if n < NINTHER_THRESHOLD:
+        return _median3(arr, lo, mid, hi - 1, stats)
+    step = n // 8
+    a = _median3(arr, lo, lo + step, lo + 2 * step, stats)
+    b = _median3(arr, mid - step, mid, mid + step, stats)
+    c = _median3(arr, hi - 1 - 2 * step, hi - 1 - step, hi - 1, stats)
+    return _median3(arr, a, b, c, stats)
+
+
+def _partition3(arr, lo, hi, pivot, stats):
+    lt = lo
+    i = lo
+    gt = hi
+    comparisons = swaps = 0
+    while i < gt:
+        x = arr[i]
+        comparisons += 1
+        if x < pivot:
+            arr[lt], arr[i] = x, arr[lt]
+            swaps += 1
+            lt += 1
+            i += 1
+        else:
+            comparisons += 1
+            if pivot < x:
+                gt -= 1
+                arr[gt], arr[i] = x, arr[gt]
+                swaps += 1
+            else:
+                i += 1
+    stats.comparisons += comparisons
+    stats.swaps += swaps
+    return lt, gt
+
+
+def _insertion_range(arr, lo, hi, stats):
+    comparisons = moves = 0
+    for i in range(lo + 1, hi):
+        x = arr[i]
+        j = i - 1
+        while j >= lo:
+            comparisons += 1
+            if not x < arr[j]:
+                break
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = x
+        moves += i - j
+    stats.comparisons += comparisons
+    stats.moves += moves
+
+
+def _sift_down(arr, lo, root, end, stats):
+    x = arr[lo + root]
+    while True:
+        child = 2 * root + 1
+        if child >= end:
+            break
+        if child + 1 < end:
+            stats.comparisons += 1
+            if arr[lo + child] < arr[lo + child + 1]:
+                child += 1
+        stats.comparisons += 1
+        if not x < arr[lo + child]:
+            break
+        arr[lo + root] = arr[lo + child]
+        stats.moves += 1
+        root = child
+    arr[lo + root] = x
+    stats.moves += 1
+
+
+def _heap_sort(arr, lo, hi, stats):
+    n = hi - lo
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lo, root, n, stats)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        stats.swaps += 1
+        _sift_down(arr, lo, 0, end, stats)
+
+
+# --- Гібридне сортування (hybrid_sort) ---
+# Злиття з галопом надто велике, щоб тримати його копію, тож тут працює справжній
+# hybrid_sort, але над обгортками: порівняння рахує _Probe, записи — _ProbeList,
+# а стек серій _RunStack повідомляє про нові серії та злиття.
+class _Probe:
+    __slots__ = ("v", "stats")
+
+    def __init__(self, v, stats):
+        self.v = v
+        self.stats = stats
+
+    def __lt__(self, other):
+        self.stats.comparisons += 1
+        return self.v < other.v
+
+
+class _ProbeList(list):
+    __slots__ = ("stats",)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # зріз — це тимчасова копія (буфер злиття або розворот серії)
+            self.stats.allocations += 1
+        return list.__getitem__(self, index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self.stats.moves += len(value)
+        else:
+            self.stats.moves += 1
+        list.__setitem__(self, index, value)
+
+
+class _RunStack(list):
+    __slots__ = ("stats", "callback")
+
+    def append(self, run):
+        list.append(self, run)
+        stats = self.stats
+        if len(self) > stats.max_depth:
+            stats.max_depth = len(self)
+        self.callback("run", stats, {"lo": run[0], "length": run[1]})
+
+    def __delitem__(self, index):
+        # hybrid_sort спершу записує об'єднану серію на місце лівої, а потім видаляє праву
+        list.__delitem__(self, index)
+        merged = self[index - 1]
+        self.stats.passes += 1
+        self.callback("merge", self.stats, {"lo": merged[0], "length": merged[1]})
+
+
+def hybrid_sort(arr, callback=None, stats=None):
+    """
+    Справжній hybrid_sort.hybrid_sort над обгортками-лічильниками.
+    callback("run", ...) для кожної серії у стеку, ("merge", ...) перед кожним злиттям
+    (length — довжина вже об'єднаної серії). max_depth — найбільша висота стеку серій.
+    """
+    stats = stats or SortStats()
+    callback = callback or _noop
+    work = _ProbeList(_Probe(x, stats) for x in arr)
+    work.stats = stats
+    state = _MergeState()
+    state.runs = _RunStack()
+    state.runs.stats = stats
+    state.runs.callback = callback
+    _hybrid_sort(work, state)
+    arr[:] = [p.v for p in list.__iter__(work)]
+    return stats
+
+
+# --- Порозрядне сортування ---
+def counting_sort(arr, key=None, callback=None, stats=None):
+    """Як radix_sort.counting_sort; callback("count", ...) і ("place", ...) після кожної фази."""
+    stats = stats or SortStats()
+    callback = callback or _noop
+    if len(arr) < 2:
+        return stats
+    keys = list(arr) if key is None else [key(x) for x in arr]
+    lo = min(keys)
+    counts = [0] * (max(keys) - lo + 1)
+    stats.allocations += 2
+    for k in keys:
+        counts[k - lo] += 1
+    stats.passes += 1
+    callback("count", stats, {"range": len(counts)})
+    total = 0
+    for i, c in enumerate(counts):
+        counts[i] = total
+        total += c
+    out = [None] * len(arr)
+    stats.allocations += 1
+    for item, k in zip(arr, keys):
+        pos = counts[k - lo]
+        out[pos] = item
+        counts[k - lo] = pos + 1
+    arr[:] = out
+    stats.moves += 2 * len(arr)
+    stats.passes += 1
+    callback("place", stats, {})
+    return stats
+
+
+def radix_sort_lsd(arr, key=None, callback=None, stats=None):
+    """Як radix_sort.radix_sort_lsd; callback("pass", ...) після кожного розряду."""
+    stats = stats or SortStats()
+    callback = callback or _noop
+    if len(arr) < 2:
+        return stats
+    keys = list(arr) if key is None else [key(x) for x in arr]
+    lo = min(keys)
+    keys = [k - lo for k in keys]
+    max_key = max(keys)
+    order = range(len(arr))
+    stats.allocations += 1
+    shift = 0
+    while max_key >> shift:
+        buckets = [[] for _ in range(RADIX)]
+        stats.allocations += RADIX
+        for i in order:
+            buckets[(keys[i] >> shift) & RADIX_MASK].append(i)
+        stats.moves += len(keys)
+        stats.passes += 1
+        # як і справжній: якщо все потрапило в один кошик, порядок не змінюється
+        skipped = any(len(b) == len(keys) for b in buckets)
+        if not skipped:
+            order = [i for b in buckets for i in b]
+            stats.allocations += 1
+            stats.moves += len(order)
+        callback("pass", stats, {"shift": shift, "used_buckets": sum(1 for b in buckets if b),
+                                 "skipped": skipped})
+        shift += RADIX_BITS
+    if not isinstance(order, range):
+        arr[:] = [arr[i] for i in order]
+        stats.moves += len(arr)
+    return stats
+
+
+def radix_sort_msd(arr, key=None, callback=None, stats=None):
+    """
+    Як radix_sort.radix_sort_msd; callback("bucket", ...) після кожного розкладання по кошиках,
+    ("insertion", ...) після досортування маленького кошика. max_depth — глибина рекурсії.
+    """
+    stats = stats or SortStats()
+    callback = callback or _noop
+    if len(arr) < 2:
+        return stats
+    keys = list(arr) if key is None else [key(x) for x in arr]
+    lo = min(keys)
+    keys = [k - lo for k in keys]
+    top_shift = max(0, (max(keys).bit_length() - 1) // RADIX_BITS * RADIX_BITS)
+    stats.allocations += 2
+    order = _msd(list(range(len(arr))), keys, top_shift, stats, callback)
+    arr[:] = [arr[i] for i in order]
+    stats.moves += len(arr)
+    return stats
+
+
+def _msd(idx, keys, shift, stats, callback):
+    stats.enter()
+    if len(idx) <= MSD_CUTOFF:
+        _insertion_by_key(idx, keys, stats)
+        callback("insertion", stats, {"length": len(idx), "depth": stats.depth})
+        stats.leave()
+        return idx
+    buckets = [[] for _ in range(RADIX)]
+    stats.allocations += RADIX
+    for i in idx:
+        buckets[(keys[i] >> shift) & RADIX_MASK].append(i)
+    stats.moves += len(idx)
+    stats.passes += 1
+    callback("bucket", stats, {"shift": shift, "length": len(idx), "depth": stats.depth,
+                               "used_buckets": sum(1 for b in buckets if b)})
+    if shift == 0:
+        result = [i for b in buckets for i in b]
+    else:
+        result = []
+        for b in buckets:
+            if len(b) > 1:
+                result.extend(_msd(b, keys, shift - RADIX_BITS, stats, callback))
+            else:
+                result.extend(b)
+    stats.moves += len(idx)
+    stats.leave()
+    return result
+
+
+def _insertion_by_key(idx, keys, stats):
+    comparisons = moves = 0
+    for i in range(1, len(idx)):
+        x = idx[i]
+        k = keys[x]
+        j = i - 1
+        while j >= 0:
+            comparisons += 1
+            if not keys[idx[j]] > k:
+                break
+            idx[j + 1] = idx[j]
+            j -= 1
+        idx[j + 1] = x
+        moves += i - j
+    stats.comparisons += comparisons
+    stats.moves += moves
+
+
+# --- Автовибір (auto_sort) ---
+def auto_sort(arr, key=None, callback=None, stats=None):
+    """
+    Як auto_sort.auto_sort: той самий choose_algorithm над тими самими ключами,
+    далі — інструментований варіант обраного шляху. callback("choose", stats, {"algorithm": ...})
+    перед сортуванням, потім події обраного алгоритму.
+    """
+    stats = stats or SortStats()
+    callback = callback or _noop
+    keys = list(arr) if key is None else [key(x) for x in arr]
+    algorithm = choose_algorithm(keys)
+    callback("choose", stats, {"algorithm": algorithm})
+    if algorithm == "counting":
+        counting_sort(arr, key, callback, stats)
+    elif algorithm == "radix":
+        radix_sort_lsd(arr, key, callback, stats)
+    elif key is None:
+        hybrid_sort(arr, callback, stats)
+    else:
+        decorated = [(k, i) for i, k in enumerate(keys)]
+        stats.allocations += 1
+        hybrid_sort(decorated, callback, stats)
+        arr[:] = [arr[i] for _, i in decorated]
+        stats.moves += len(arr)
+    return stats
+
+
+ALGORITHMS = {
+    "bubble_sort": bubble_sort,
+    "insertion_sort": insertion_sort,
+    "selection_sort": selection_sort,
+    "quick_sort": quick_sort,
+    "introsort": quick_sort,
+    "hybrid_sort": hybrid_sort,
+    "counting_sort": counting_sort,
+    "radix_sort_lsd": radix_sort_lsd,
+    "radix_sort_msd": radix_sort_msd,
+    "auto_sort": auto_sort,
+}
+
+
+def sort(name, arr, callback=None):
+    """Сортує arr на місці інструментованим варіантом алгоритму name. Повертає SortStats."""
+    return ALGORITHMS[name](arr, callback=callback)
+
+
+if __name__ == "__main__":
+    import random
+
+    data = [random.randint(0, 1000) for _ in range(200)]
+    for name in ALGORITHMS:
+        work = list(data)
+        stats = sort(name, work)
+        assert work == sorted(data), name
+        print(f"{name:16}", stats.as_dict())
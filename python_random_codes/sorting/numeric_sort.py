@@ -0,0 +1,90 @@
+from array import array
+
+from quick_sort import introsort
+
+try:
+    import numpy as np
+except ImportError:  # без NumPy працює повільний, але коректний запасний шлях
+    np = None
+
+# Коди типів array.array / форматів memoryview, які вважаємо числовими
+NUMERIC_FORMATS = set("bBhHiIlLqQfd")
+
+
+def numeric_sort(buf, kind="quicksort"):
+    """
+    Сортує числовий буфер на місці без перетворення у список:
+    array.array, memoryview (одновимірний, суцільний, доступний для запису) або масив NumPy.
+    З NumPy сортування йде у C (kind: "quicksort" — інтросорт, "stable" — radix/timsort).
+    Без NumPy буфер сортується на місці нашим introsort.
+    Повертає buf.
+    """
+    view = as_numpy(buf)
+    if view is not None:
+        view.sort(kind=kind)
+    else:
+        introsort(_checked_view(buf))
+    return buf
+
+
+def numeric_partition(buf, kth):
+    """
+    Розбиває числовий буфер на місці так, що на позиції kth стоїть той елемент,
+    що стояв би там після сортування; ліворуч — не більші, праворуч — не менші.
+    Потребує NumPy (векторизований introselect).
+    """
+    view = as_numpy(buf)
+    if view is None:
+        raise RuntimeError("numeric_partition потребує NumPy")
+    view.partition(kth)
+    return buf
+
+
+def as_numpy(buf):
+    """
+    Повертає масив NumPy, що ділить пам'ять з buf (без копіювання),
+    або None, якщо NumPy не встановлено.
+    """
+    if np is None:
+        return None
+    if isinstance(buf, np.ndarray):
+        view = buf
+    else:
+        mv = _checked_view(buf)
+        view = np.frombuffer(mv, dtype=np.dtype(mv.format))
+    if view.ndim != 1:
+        raise ValueError("підтримуються лише одновимірні буфери")
+    if view.dtype.kind not in "iuf":
+        raise TypeError(f"нечисловий тип елементів: {view.dtype}")
+    if not view.flags.writeable:
+        raise TypeError("буфер доступний лише для читання")
+    return view
+
+
+def _checked_view(buf):
+    """Перевіряє array.array / memoryview і повертає memoryview для сортування на місці."""
+    if not isinstance(buf, (array, memoryview)):
+        raise TypeError(f"очікується array.array, memoryview або numpy.ndarray, отримано {type(buf).__name__}")
+    mv = memoryview(buf)
+    if mv.ndim != 1:
+        raise ValueError("підтримуються лише одновимірні буфери")
+    if not mv.c_contiguous:
+        # зріз із кроком (memoryview(a)[::2]) NumPy не відкриє без копії — тож і запасний шлях його не бере
+        raise ValueError("підтримуються лише суцільні буфери, без кроку (скопіюйте зріз у новий масив)")
+    if mv.readonly:
+        raise TypeError("буфер доступний лише для читання")
+    fmt = mv.format.lstrip("@")
+    if fmt not in NUMERIC_FORMATS:
+        raise TypeError(f"нечисловий формат буфера: {mv.format!r}")
+    return mv.cast("B").cast(fmt) if fmt != mv.format else mv
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    n = 10_000_000 if np is not None else 100_000
+    data = array("q", (random.randrange(1 << 40) for _ in range(n)))
+    t0 = time.perf_counter()
+    numeric_sort(data)
+    print(f"n={n}: {time.perf_counter() - t0:.3f}s, відсортовано:", all(data[i] <= data[i + 1] for i in range(0, n - 1, n // 1000)))
@@ -0,0 +1,185 @@
+import heapq
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from multiprocessing import Pool, shared_memory
+
+from numeric_sort import numeric_sort, np
+
+# Менші масиви сортуємо в одному процесі: запуск пулу дорожчий за саму роботу
+MIN_PARALLEL_SIZE = 100_000
+# Скільки вибірок на кожну частину бере кожен шматок: більше — рівніші частини злиття
+OVERSAMPLE = 32
+
+
+def parallel_sort(data, typecode="d", workers=None):
+    """
+    Сортує числові дані на кількох ядрах.
+    data — array.array (сортується на місці) або послідовність чисел
+    (тоді створюється array.array(typecode)). Повертає відсортований array.array.
+
+    1. Дані копіюються у multiprocessing.shared_memory — процеси бачать їх без pickle.
+    2. Кожен процес сортує свій шматок на місці (numeric_sort: NumPy або наш introsort).
+    3. За вибіркою зі шматків обираються роздільники, і кожен процес зливає
+       свій діапазон значень з усіх шматків (k-way merge) у свою частину результату.
+    """
+    if not isinstance(data, array):
+        data = array(typecode, data)
+    n = len(data)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n < MIN_PARALLEL_SIZE:
+        numeric_sort(data)
+        return data
+
+    typecode = data.typecode
+    src = shared_memory.SharedMemory(create=True, size=n * data.itemsize)
+    dst = shared_memory.SharedMemory(create=True, size=n * data.itemsize)
+    src_view = src.buf.cast("B").cast(typecode)
+    dst_view = dst.buf.cast("B").cast(typecode)
+    try:
+        src_view[:] = data
+        bounds = [n * i // workers for i in range(workers + 1)]
+        chunks = list(zip(bounds, bounds[1:]))
+
+        with Pool(workers) as pool:
+            pool.starmap(_sort_chunk, [(src.name, typecode, lo, hi) for lo, hi in chunks])
+
+            parts = _split_for_merge(src_view, chunks, workers)
+            pool.starmap(_merge_part, [(src.name, dst.name, typecode, runs, offset)
+                                       for runs, offset in parts])
+
+        memoryview(data)[:] = dst_view
+    finally:
+        src_view.release()
+        dst_view.release()
+        for shm in (src, dst):
+            shm.close()
+            shm.unlink()
+    return data
+
+
+def _split_for_merge(view, chunks, parts):
+    """
+    Обирає parts-1 роздільників за рівномірною вибіркою з відсортованих шматків
+    (OVERSAMPLE вибірок на частину з кожного шматка).
+    Для кожної частини повертає (відрізки шматків, що в неї потрапляють, зсув у результаті).
+    """
+    samples = []
+    for lo, hi in chunks:
+        step = max(1, (hi - lo) // (parts * OVERSAMPLE))
+        samples.extend(view[i] for i in range(lo + step // 2, hi, step))
+    samples.sort()
+    n = sum(hi - lo for lo, hi in chunks)
+
+    # межі кожного шматка для кожного роздільника
+    cuts = [[lo for lo, _ in chunks]]
+    for p in range(1, parts):
+        s = samples[len(samples) * p // parts]
+        lows = [bisect_left(view, s, lo, hi) for lo, hi in chunks]
+        highs = [bisect_right(view, s, lo, hi) for lo, hi in chunks]
+        # рівні s ділимо за позицією: ліворуч іде стільки, щоб межа впала на ранг n*p/parts,
+        # інакше при повторах уся серія однакових ключів дістається одній частині
+        need = n * p // parts - sum(low - lo for low, (lo, _) in zip(lows, chunks))
+        cut = []
+        for low, high in zip(lows, highs):
+            take = min(max(need, 0), high - low)
+            cut.append(low + take)
+            need -= take
+        cuts.append(cut)
+    cuts.append([hi for _, hi in chunks])
+
+    result = []
+    offset = 0
+    for p in range(parts):
+        runs = [(lo, hi) for lo, hi in zip(cuts[p], cuts[p + 1]) if lo < hi]
+        result.append((runs, offset))
+        offset += sum(hi - lo for lo, hi in runs)
+    return result
+
+
+# --- Функції процесів-працівників (на верхньому рівні модуля, щоб їх можна було запустити у spawn) ---
+def _attach(name, typecode):
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, shm.buf.cast("B").cast(typecode)
+
+
+def _sort_chunk(name, typecode, lo, hi):
+    shm, view = _attach(name, typecode)
+    try:
+        part = view[lo:hi]
+        numeric_sort(part)
+        part.release()
+    finally:
+        view.release()
+        shm.close()
+
+
+def _merge_part(src_name, dst_name, typecode, runs, offset):
+    src, src_view = _attach(src_name, typecode)
+    dst, dst_view = _attach(dst_name, typecode)
+    try:
+        total = sum(hi - lo for lo, hi in runs)
+        if np is not None:
+            # конкатенація відсортованих серій + стабільне сортування (timsort у NumPy зливає серії)
+            src_arr = np.frombuffer(src_view, dtype=typecode)
+            out = np.frombuffer(dst_view, dtype=typecode)[offset:offset + total]
+            if runs:
+                out[:] = np.concatenate([src_arr[lo:hi] for lo, hi in runs])
+                out.sort(kind="stable")
+            del src_arr, out
+        else:
+            i = offset
+            for value in heapq.merge(*(src_view[lo:hi] for lo, hi in runs)):
+                dst_view[i] = value
+                i += 1
+    finally:
+        src_view.release()
+        dst_view.release()
+        src.close()
+        dst.close()
+
+
+# --- Бенчмарк прискорення ---
+def speedup_curve(n, max_workers=None, typecode="d", seed=0):
+    """Міряє час parallel_sort для 1..max_workers процесів. Повертає список (workers, секунди, прискорення)."""
+    import random
+    import time
+
+    max_workers = max_workers or os.cpu_count() or 1
+    rnd = random.Random(seed)
+    if typecode in "fd":
+        source = array(typecode, (rnd.random() for _ in range(n)))
+    else:
+        source = array(typecode, (rnd.randrange(1 << 31) for _ in range(n)))
+
+    rows = []
+    base = None
+    for w in range(1, max_workers + 1):
+        data = array(typecode, source)
+        t0 = time.perf_counter()
+        parallel_sort(data, workers=w)
+        elapsed = time.perf_counter() - t0
+        base = base or elapsed
+        rows.append((w, elapsed, base / elapsed))
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Крива прискорення паралельного сортування")
+    parser.add_argument("--n", type=int, default=10_000_000)
+    parser.add_argument("--max-workers", type=int, default=None)
+    parser.add_argument("--typecode", default="d")
+    parser.add_argument("--out", default=None, help="зберегти результати у JSON")
+    args = parser.parse_args()
+
+    rows = speedup_curve(args.n, args.max_workers, args.typecode)
+    print(f"{'процеси':>8} {'час, с':>10} {'прискорення':>12}")
+    for w, elapsed, speedup in rows:
+        print(f"{w:>8} {elapsed:>10.3f} {speedup:>12.2f}")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"n": args.n, "typecode": args.typecode,
+                       "results": [{"workers": w, "time_s": t, "speedup": s} for w, t, s in rows]}, f, indent=1)
@@ -1,19 +1,154 @@
-def quick_sort(arr):
-    if len(arr) <= 1:
+def quick_sort(arr, in_place=False, key=None, reverse=False):
+    """
+    Швидке сортування (інтросорт).
+    За замовчуванням повертає новий відсортований список і не змінює arr.
+    З in_place=True сортує сам arr і повертає його.
+    Без key і reverse НЕ стабільне. Інакше елементи сортуються за парами (ключ, початковий індекс):
+    ключ рахується один раз, а однакові ключі зберігають початковий порядок.
+    """
+    if not in_place:
+        arr = list(arr)
+    if key is None and not reverse:
+        introsort(arr)
         return arr
 
-    pivot = arr[-1]
-    left = []
-    right = []
+    # reverse = розвернути, стабільно відсортувати, розвернути
+    if reverse:
+        arr.reverse()
+    keys = arr if key is None else [key(x) for x in arr]
+    decorated = [(k, i) for i, k in enumerate(keys)]
+    introsort(decorated)
+    arr[:] = [arr[i] for _, i in decorated]
+    if reverse:
+        arr.reverse()
+    return arr
 
-    for x in arr[:-1]:
+
+# Розділи, менші за цей розмір, досортовуємо вставками
+INSERTION_CUTOFF = 16
+# Для великих розділів опорний елемент — медіана з трьох медіан (ninther)
+NINTHER_THRESHOLD = 128
+
+
+def introsort(arr, lo=0, hi=None):
+    """
+    Сортує arr[lo:hi] на місці:
+    - опорний елемент — медіана з трьох (або ninther для великих розділів)
+    - трьохстороннє розбиття, щоб серії однакових ключів не обробляти повторно
+    - heapsort, якщо рекурсія занадто глибока (гарантія O(n log n))
+    - сортування вставками для маленьких розділів
+    Рекурсія йде лише в меншу частину, тож глибина стеку O(log n).
+    """
+    if hi is None:
+        hi = len(arr)
+    if hi - lo < 2:
+        return
+    depth_limit = 2 * (hi - lo).bit_length()
+    _introsort(arr, lo, hi, depth_limit)
+
+
+def _introsort(arr, lo, hi, depth_limit):
+    while hi - lo > INSERTION_CUTOFF:
+        if depth_limit == 0:
+            _heap_sort(arr, lo, hi)
+            return
+        depth_limit -= 1
+
+        pivot = arr[_choose_pivot(arr, lo, hi)]
+        lt, gt = _partition3(arr, lo, hi, pivot)
+
+        # менша частина — рекурсією, більша — в циклі
+        if lt - lo < hi - gt:
+            _introsort(arr, lo, lt, depth_limit)
+            lo = gt
+        else:
+            _introsort(arr, gt, hi, depth_limit)
+            hi = lt
+    _insertion_sort(arr, lo, hi)
+
+
+def _median3(arr, a, b, c):
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+
+def _choose_pivot(arr, lo, hi):
+    n = hi - lo
+    mid = lo + n // 2
+    if n < NINTHER_THRESHOLD:
+        return _median3(arr, lo, mid, hi - 1)
+    step = n // 8
+    a = _median3(arr, lo, lo + step, lo + 2 * step)
+    b = _median3(arr, mid - step, mid, mid + step)
+    c = _median3(arr, hi - 1 - 2 * step, hi - 1 - step, hi - 1)
+    return _median3(arr, a, b, c)
+
+
+def _partition3(arr, lo, hi, pivot):
+    """
+    Розбиття Дейкстри на три частини:
+    arr[lo:lt] < pivot, arr[lt:gt] == pivot, arr[gt:hi] > pivot.
+    Повертає (lt, gt).
+    """
+    lt = lo
+    i = lo
+    gt = hi
+    while i < gt:
+        x = arr[i]
         if x < pivot:
-            left.append(x)
+            arr[lt], arr[i] = x, arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < x:
+            gt -= 1
+            arr[gt], arr[i] = x, arr[gt]
         else:
-            right.append(x)
+            i += 1
+    return lt, gt
+
+
+def _insertion_sort(arr, lo, hi):
+    for i in range(lo + 1, hi):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and key < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def _sift_down(arr, lo, root, end):
+    # end — кількість елементів купи, root — індекс відносно lo
+    x = arr[lo + root]
+    while True:
+        child = 2 * root + 1
+        if child >= end:
+            break
+        if child + 1 < end and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if not x < arr[lo + child]:
+            break
+        arr[lo + root] = arr[lo + child]
+        root = child
+    arr[lo + root] = x
+
+
+def _heap_sort(arr, lo, hi):
+    n = hi - lo
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lo, root, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
 
-    return quick_sort(left) + [pivot] + quick_sort(right)
 
-numbers=[5, 3, 8, 4, 2]
-quick_sort(numbers)
-print("Відсортований список:", numbers)
\ No newline at end of file
+if __name__ == "__main__":
+    numbers=[5, 3, 8, 4, 2]
+    print("Відсортований список:", quick_sort(numbers))
+    quick_sort(numbers, in_place=True)
+    print("Відсортований на місці:", numbers)
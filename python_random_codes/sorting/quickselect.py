@@ -0,0 +1,134 @@
+import heapq
+
+from quick_sort import INSERTION_CUTOFF, _choose_pivot, _insertion_sort, _partition3, introsort
+
+
+def nth_element(arr, n, key=None):
+    """
+    Переставляє arr на місці так, що arr[n] — той елемент, що стояв би там після сортування,
+    ліворуч від нього — не більші, праворуч — не менші (як std::nth_element).
+    Quickselect з розбиттям quick_sort; щойно два розбиття поспіль не зменшили діапазон
+    хоча б удвічі — опорний елемент «медіана медіан», тож у гіршому випадку O(n). Повертає arr[n].
+    """
+    if not 0 <= n < len(arr):
+        raise IndexError("n поза межами масиву")
+    if key is None:
+        _select(arr, 0, len(arr), n)
+        return arr[n]
+    decorated = [(key(x), i) for i, x in enumerate(arr)]
+    _select(decorated, 0, len(decorated), n)
+    arr[:] = [arr[i] for _, i in decorated]
+    return arr[n]
+
+
+def partial_sort(arr, k, key=None):
+    """
+    Сортує на місці лише перші k елементів: arr[:k] — k найменших у порядку зростання,
+    решта — у довільному порядку. O(n + k log k).
+    """
+    k = min(k, len(arr))
+    if k <= 0:
+        return
+    if key is None:
+        _select(arr, 0, len(arr), k - 1)
+        introsort(arr, 0, k)
+        return
+    decorated = [(key(x), i) for i, x in enumerate(arr)]
+    _select(decorated, 0, len(decorated), k - 1)
+    introsort(decorated, 0, k)
+    arr[:] = [arr[i] for _, i in decorated]
+
+
+def top_k(iterable, k, key=None, largest=False):
+    """
+    Повертає k найменших (або найбільших) елементів будь-якого ітератора у відсортованому порядку.
+    Тримає в пам'яті лише купу з k елементів: O(n log k), один прохід.
+    Однакові ключі зберігають порядок надходження.
+    """
+    if k <= 0:
+        return []
+    heap = []
+    if largest:
+        # мін-купа з (ключ, -індекс): на вершині — найгірший з k найбільших
+        for i, x in enumerate(iterable):
+            entry = (x if key is None else key(x), -i, x)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif heap[0] < entry:
+                heapq.heapreplace(heap, entry)
+        heap.sort(reverse=True)
+        return [x for _, _, x in heap]
+
+    # макс-купа через обернене порівняння: на вершині — найгірший з k найменших
+    for i, x in enumerate(iterable):
+        entry = _MaxEntry(x if key is None else key(x), i, x)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry.k < heap[0].k:
+            heapq.heapreplace(heap, entry)
+    heap.sort(reverse=True)
+    return [e.item for e in heap]
+
+
+class _MaxEntry:
+    __slots__ = ("k", "i", "item")
+
+    def __init__(self, k, i, item):
+        self.k = k
+        self.i = i
+        self.item = item
+
+    def __lt__(self, other):
+        # «менший» для heapq = більший за (ключ, індекс)
+        if self.k == other.k:
+            return self.i > other.i
+        return other.k < self.k
+
+
+# --- Quickselect з гарантією O(n) ---
+def _select(arr, lo, hi, n):
+    # швидкі опорні, доки кожні два розбиття хоча б уполовинюють діапазон: до перемикання
+    # робота — геометрична сума O(n), а після нього медіана медіан відтинає >= 30% за раунд
+    fallback = False
+    rounds = 0
+    mark = hi - lo
+    while hi - lo > INSERTION_CUTOFF:
+        if fallback:
+            pivot = _median_of_medians(arr, lo, hi)
+        else:
+            pivot = arr[_choose_pivot(arr, lo, hi)]
+        lt, gt = _partition3(arr, lo, hi, pivot)
+        if n < lt:
+            hi = lt
+        elif n >= gt:
+            lo = gt
+        else:
+            return
+        if not fallback:
+            rounds += 1
+            if rounds == 2:
+                fallback = hi - lo > mark // 2
+                rounds = 0
+                mark = hi - lo
+    _insertion_sort(arr, lo, hi)
+
+
+def _median_of_medians(arr, lo, hi):
+    """Медіани груп по 5 переносимо на початок діапазону і рекурсивно шукаємо їхню медіану."""
+    m = lo
+    for start in range(lo, hi, 5):
+        end = min(start + 5, hi)
+        _insertion_sort(arr, start, end)
+        mid = (start + end - 1) // 2
+        arr[m], arr[mid] = arr[mid], arr[m]
+        m += 1
+    mid = lo + (m - lo) // 2
+    _select(arr, lo, m, mid)
+    return arr[mid]
+
+
+if __name__ == "__main__":
+    numbers = [9, 1, 8, 2, 7, 3, 6, 4, 5]
+    print("Медіана:", nth_element(list(numbers), len(numbers) // 2))
+    print("3 найменші:", top_k(numbers, 3))
+    print("3 найбільші:", top_k(iter(numbers), 3, largest=True))
@@ -0,0 +1,130 @@
+RADIX_BITS = 8
+RADIX = 1 << RADIX_BITS
+RADIX_MASK = RADIX - 1
+
+# Кошики MSD, менші за цей розмір, досортовуємо вставками за ключем
+MSD_CUTOFF = 32
+
+
+def counting_sort(arr, key=None):
+    """
+    Стабільне сортування підрахунком на місці.
+    Ключі (arr[i] або key(arr[i])) — цілі числа, можуть бути від'ємними.
+    Час і пам'ять O(n + діапазон ключів).
+    """
+    if len(arr) < 2:
+        return
+    _counting_sort(arr, _int_keys(arr, key))
+
+
+def _counting_sort(arr, keys):
+    lo = min(keys)
+    counts = [0] * (max(keys) - lo + 1)
+    for k in keys:
+        counts[k - lo] += 1
+
+    # префіксні суми -> позиція першого елемента кожного ключа
+    total = 0
+    for i, c in enumerate(counts):
+        counts[i] = total
+        total += c
+
+    out = [None] * len(arr)
+    for item, k in zip(arr, keys):
+        pos = counts[k - lo]
+        out[pos] = item
+        counts[k - lo] = pos + 1
+    arr[:] = out
+
+
+def radix_sort_lsd(arr, key=None):
+    """
+    Стабільне порозрядне сортування (LSD) на місці, по RADIX_BITS біт за прохід.
+    Ключі — цілі числа, можуть бути від'ємними (зсуваються на мінімум).
+    Час O(n * w / RADIX_BITS), де w — кількість біт у діапазоні ключів.
+    """
+    if len(arr) < 2:
+        return
+    _radix_sort_lsd(arr, _int_keys(arr, key))
+
+
+def _radix_sort_lsd(arr, keys):
+    lo = min(keys)
+    keys = [k - lo for k in keys]
+    max_key = max(keys)
+
+    order = range(len(arr))
+    shift = 0
+    while max_key >> shift:
+        buckets = [[] for _ in range(RADIX)]
+        for i in order:
+            buckets[(keys[i] >> shift) & RADIX_MASK].append(i)
+        # якщо все потрапило в один кошик, прохід нічого не змінив
+        if any(len(b) == len(keys) for b in buckets):
+            shift += RADIX_BITS
+            continue
+        order = [i for b in buckets for i in b]
+        shift += RADIX_BITS
+
+    if not isinstance(order, range):
+        arr[:] = [arr[i] for i in order]
+
+
+def radix_sort_msd(arr, key=None):
+    """
+    Стабільне порозрядне сортування (MSD) на місці: від старших біт до молодших,
+    кошики сортуються рекурсивно, маленькі — вставками.
+    Вигідне, коли ключі розподілені нерівномірно або старші біти швидко розділяють дані.
+    """
+    if len(arr) < 2:
+        return
+    keys = _int_keys(arr, key)
+    lo = min(keys)
+    keys = [k - lo for k in keys]
+    top_shift = max(0, (max(keys).bit_length() - 1) // RADIX_BITS * RADIX_BITS)
+
+    order = _msd(list(range(len(arr))), keys, top_shift)
+    arr[:] = [arr[i] for i in order]
+
+
+def _msd(idx, keys, shift):
+    if len(idx) <= MSD_CUTOFF:
+        _insertion_sort_by_key(idx, keys)
+        return idx
+    buckets = [[] for _ in range(RADIX)]
+    for i in idx:
+        buckets[(keys[i] >> shift) & RADIX_MASK].append(i)
+    if shift == 0:
+        return [i for b in buckets for i in b]
+    result = []
+    for b in buckets:
+        if len(b) > 1:
+            result.extend(_msd(b, keys, shift - RADIX_BITS))
+        else:
+            result.extend(b)
+    return result
+
+
+def _insertion_sort_by_key(idx, keys):
+    for i in range(1, len(idx)):
+        x = idx[i]
+        k = keys[x]
+        j = i - 1
+        while j >= 0 and keys[idx[j]] > k:
+            idx[j + 1] = idx[j]
+            j -= 1
+        idx[j + 1] = x
+
+
+def _int_keys(arr, key):
+    keys = list(arr) if key is None else [key(x) for x in arr]
+    for k in keys:
+        if not isinstance(k, int):
+            raise TypeError(f"порозрядне сортування потребує цілих ключів, отримано {type(k).__name__}")
+    return keys
+
+
+if __name__ == "__main__":
+    numbers = [170, -45, 75, -90, 802, 24, 2, 66]
+    radix_sort_lsd(numbers)
+    print("Відсортований список:", numbers)
@@ -1,12 +1,31 @@
-def selection_sort(arr):
-    for i in range(len(arr) - 1):
-        min_index = i
-        for j in range(i + 1, len(arr)):
-            if arr[j] < arr[min_index]:
-                min_index = j
-        if min_index != i:
-            arr[i], arr[min_index] = arr[min_index], arr[i]
+def selection_sort(arr, key=None, reverse=False):
+    """
+    Сортування вибором на місці.
+    Без key і reverse НЕ стабільне (обмін може перестрибнути через рівний елемент).
+    Інакше елементи сортуються за парами (ключ, початковий індекс) — ключ рахується
+    один раз, а однакові ключі зберігають початковий порядок, тож сортування стабільне.
+    """
+    if key is None and not reverse:
+        for i in range(len(arr) - 1):
+            min_index = i
+            for j in range(i + 1, len(arr)):
+                if arr[j] < arr[min_index]:
+                    min_index = j
+            if min_index != i:
+                arr[i], arr[min_index] = arr[min_index], arr[i]
+        return
 
-numbers = [5, 3, 8, 4, 2]
-selection_sort(numbers)
-print("Відсортований список:", numbers)
+    # reverse = розвернути, стабільно відсортувати, розвернути
+    if reverse:
+        arr.reverse()
+    keys = list(arr) if key is None else [key(x) for x in arr]
+    decorated = [(k, i) for i, k in enumerate(keys)]
+    selection_sort(decorated)
+    arr[:] = [arr[i] for _, i in decorated]
+    if reverse:
+        arr.reverse()
+
+if __name__ == "__main__":
+    numbers = [5, 3, 8, 4, 2]
+    selection_sort(numbers)
+    print("Відсортований список:", numbers)
@@ -0,0 +1,338 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, islice
+
+# Бажана довжина одного шматка; шматок ділиться навпіл, коли стає вдвічі довшим
+LOAD = 1000
+
+
+class SortedList:
+    """
+    Відсортована колекція для потокових вставок: список відсортованих шматків
+    (~LOAD елементів) плюс список їхніх максимумів для bisect.
+    - add / remove: O(log n) на пошук + зсув усередині одного шматка
+    - доступ за індексом і index(): O(log n) через дерево Фенвіка за довжинами шматків
+    - irange(): елементи з діапазону значень без копіювання всієї колекції
+    - merge(): злиття вже відсортованої партії за один прохід по шматках
+    """
+
+    def __init__(self, iterable=()):
+        self._lists = []
+        self._maxes = []
+        self._len = 0
+        self._tree = None  # дерево Фенвіка за довжинами шматків; None — треба перебудувати
+        if iterable:
+            self.update(iterable)
+
+    # --- Розмір та ітерація ---
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        return chain.from_iterable(reversed(chunk) for chunk in reversed(self._lists))
+
+    def __repr__(self):
+        return f"SortedList({list(self)!r})"
+
+    def __contains__(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        chunk = self._lists[pos]
+        i = bisect_left(chunk, value)
+        return chunk[i] == value
+
+    def count(self, value):
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    # --- Вставка ---
+    def add(self, value):
+        maxes = self._maxes
+        if not maxes:
+            self._lists.append([value])
+            maxes.append(value)
+            self._len = 1
+            self._tree = None
+            return
+        pos = bisect_right(maxes, value)
+        if pos == len(maxes):
+            pos -= 1
+            self._lists[pos].append(value)
+            maxes[pos] = value
+        else:
+            insort(self._lists[pos], value)
+        self._len += 1
+        self._grew(pos)
+
+    def update(self, iterable):
+        """Додає довільні (невідсортовані) значення."""
+        values = sorted(iterable)
+        if values:
+            self.merge(values)
+
+    def merge(self, sorted_values):
+        """
+        Вливає вже відсортовану партію. Кожен шматок отримує свою частину партії
+        й зливається з нею за лінійний час (дві серії -> timsort у C).
+        """
+        values = sorted_values if isinstance(sorted_values, list) else list(sorted_values)
+        if not values:
+            return
+        if not self._lists:
+            self._lists = [values[i:i + LOAD] for i in range(0, len(values), LOAD)]
+            self._maxes = [chunk[-1] for chunk in self._lists]
+            self._len = len(values)
+            self._tree = None
+            return
+
+        lists = self._lists
+        maxes = self._maxes
+        start = 0
+        last = len(lists) - 1
+        for pos in range(len(lists)):
+            # усе, що не більше за максимум шматка, йде в нього; решта — в останній
+            end = len(values) if pos == last else bisect_right(values, maxes[pos], start)
+            if end > start:
+                chunk = lists[pos]
+                chunk.extend(values[start:end])
+                chunk.sort()
+                maxes[pos] = chunk[-1]
+                start = end
+        self._len += len(values)
+        self._rechunk()
+
+    # --- Видалення ---
+    def remove(self, value):
+        if not self.discard(value):
+            raise ValueError(f"{value!r} немає у SortedList")
+
+    def discard(self, value):
+        """Видаляє одне входження value. Повертає True, якщо його знайдено."""
+        maxes = self._maxes
+        pos = bisect_left(maxes, value)
+        if pos == len(maxes):
+            return False
+        chunk = self._lists[pos]
+        i = bisect_left(chunk, value)
+        if chunk[i] != value:
+            return False
+        self._delete(pos, i)
+        return True
+
+    def pop(self, index=-1):
+        pos, i = self._locate(index)
+        value = self._lists[pos][i]
+        self._delete(pos, i)
+        return value
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            drop = set(range(*index.indices(self._len)))
+            keep = [v for i, v in enumerate(self) if i not in drop]
+            self.clear()
+            self.merge(keep)
+            return
+        pos, i = self._locate(index)
+        self._delete(pos, i)
+
+    def clear(self):
+        self._lists = []
+        self._maxes = []
+        self._len = 0
+        self._tree = None
+
+    # --- Пошук за значенням ---
+    def bisect_left(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._prefix(pos) + bisect_left(self._lists[pos], value)
+
+    def bisect_right(self, value):
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._prefix(pos) + bisect_right(self._lists[pos], value)
+
+    def index(self, value):
+        i = self.bisect_left(value)
+        if i == self._len or self[i] != value:
+            raise ValueError(f"{value!r} немає у SortedList")
+        return i
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """Ітератор по значеннях з [minimum, maximum] (межі можна зробити виключними)."""
+        if minimum is None:
+            start = 0
+        else:
+            start = self.bisect_left(minimum) if inclusive[0] else self.bisect_right(minimum)
+        if maximum is None:
+            stop = self._len
+        else:
+            stop = self.bisect_right(maximum) if inclusive[1] else self.bisect_left(maximum)
+        return self._islice(start, stop)
+
+    # --- Доступ за індексом ---
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self._islice(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        pos, i = self._locate(index)
+        return self._lists[pos][i]
+
+    def _islice(self, start, stop):
+        if start >= stop:
+            return iter(())
+        pos, i = self._locate(start)
+        first = islice(self._lists[pos], i, None)
+        rest = chain.from_iterable(self._lists[pos + 1:])
+        return islice(chain(first, rest), stop - start)
+
+    # --- Внутрішнє: шматки та дерево Фенвіка ---
+    def _grew(self, pos):
+        chunk = self._lists[pos]
+        if len(chunk) > 2 * LOAD:
+            half = len(chunk) // 2
+            self._lists.insert(pos + 1, chunk[half:])
+            del chunk[half:]
+            self._maxes[pos] = chunk[-1]
+            self._maxes.insert(pos + 1, self._lists[pos + 1][-1])
+            self._tree = None
+        elif self._tree is not None:
+            self._tree_add(pos, 1)
+
+    def _delete(self, pos, i):
+        chunk = self._lists[pos]
+        del chunk[i]
+        self._len -= 1
+        if not chunk:
+            del self._lists[pos]
+            del self._maxes[pos]
+            self._tree = None
+            return
+        self._maxes[pos] = chunk[-1]
+        if len(chunk) < LOAD // 4 and len(self._lists) > 1:
+            # маленький шматок зливаємо з сусідом
+            other = pos + 1 if pos + 1 < len(self._lists) else pos - 1
+            lo, hi = min(pos, other), max(pos, other)
+            self._lists[lo].extend(self._lists[hi])
+            self._maxes[lo] = self._lists[lo][-1]
+            del self._lists[hi]
+            del self._maxes[hi]
+            self._tree = None
+            self._grew(lo)
+        elif self._tree is not None:
+            self._tree_add(pos, -1)
+
+    def _rechunk(self):
+        lists = []
+        for chunk in self._lists:
+            if len(chunk) > 2 * LOAD:
+                lists.extend(chunk[i:i + LOAD] for i in range(0, len(chunk), LOAD))
+            else:
+                lists.append(chunk)
+        self._lists = lists
+        self._maxes = [chunk[-1] for chunk in lists]
+        self._tree = None
+
+    def _build_tree(self):
+        tree = [len(chunk) for chunk in self._lists]
+        for i in range(len(tree)):
+            j = i | (i + 1)
+            if j < len(tree):
+                tree[j] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, pos, delta):
+        tree = self._tree
+        while pos < len(tree):
+            tree[pos] += delta
+            pos |= pos + 1
+
+    def _prefix(self, pos):
+        """Кількість елементів у шматках 0..pos-1."""
+        if self._tree is None:
+            self._build_tree()
+        tree = self._tree
+        total = 0
+        pos -= 1
+        while pos >= 0:
+            total += tree[pos]
+            pos = (pos & (pos + 1)) - 1
+        return total
+
+    def _locate(self, index):
+        """Індекс у колекції -> (номер шматка, індекс у шматку)."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("індекс SortedList поза межами")
+        if self._tree is None:
+            self._build_tree()
+        tree = self._tree
+        # спуск по дереву Фенвіка: шукаємо шматок, у якому лежить index
+        pos = 0
+        step = 1 << (len(tree).bit_length() - 1)
+        while step:
+            nxt = pos + step
+            if nxt <= len(tree) and tree[nxt - 1] <= index:
+                index -= tree[nxt - 1]
+                pos = nxt
+            step >>= 1
+        return pos, index
+
+
+# --- Бенчмарк: SortedList проти пересортування після кожної партії ---
+def bench_batches(total=100_000, batch=1000, seed=0):
+    # пересортування після кожної партії квадратичне за кількістю партій — за замовчуванням
+    # розмір, що проходить за секунду-дві; більший — явно: python sorted_list.py 1000000 1000
+    import random
+    import time
+    from hybrid_sort import hybrid_sort
+    from insertion_sort import insertion_sort
+
+    rnd = random.Random(seed)
+    batches = [[rnd.random() for _ in range(batch)] for _ in range(total // batch)]
+    results = {}
+
+    t0 = time.perf_counter()
+    sl = SortedList()
+    for b in batches:
+        sl.update(b)
+    results["SortedList.update"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    sl = SortedList()
+    for b in batches[:max(1, len(batches) // 10)]:
+        for x in b:
+            sl.add(x)
+    results["SortedList.add (1/10 даних)"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    data = []
+    for b in batches:
+        data.extend(b)
+        hybrid_sort(data)
+    results["extend + hybrid_sort"] = time.perf_counter() - t0
+
+    # insertion_sort після кожної партії квадратичний — міряємо на меншій частині
+    t0 = time.perf_counter()
+    data = []
+    for b in batches[:max(1, len(batches) // 100)]:
+        data.extend(b)
+        insertion_sort(data)
+    results["extend + insertion_sort (1/100 даних)"] = time.perf_counter() - t0
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    for name, seconds in bench_batches(total, batch).items():
+        print(f"{name:40} {seconds:8.3f}s")
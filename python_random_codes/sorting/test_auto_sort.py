@@ -0,0 +1,29 @@
+# test_auto_sort.py
+# Запуск:  python -m pytest -q   (з теки sorting)
+import random
+
+from auto_sort import auto_sort, choose_algorithm
+
+
+def _keys(n, span, seed=0):
+    rnd = random.Random(seed)
+    return [rnd.randrange(span) for _ in range(n)]
+
+
+def test_narrow_range_uses_counting():
+    # саме для цього випадку й існує counting: один прохід радикса тут повільніший
+    assert choose_algorithm(_keys(100_000, 100)) == "counting"
+    assert choose_algorithm(_keys(100_000, 5000)) == "counting"
+
+
+def test_wide_range_uses_radix_or_comparison():
+    assert choose_algorithm(_keys(100_000, 1 << 40)) == "radix"
+    assert choose_algorithm(_keys(1000, 1 << 40)) == "comparison"
+    assert choose_algorithm([0.5, 0.25]) == "comparison"
+
+
+def test_auto_sort_sorts_every_path():
+    for data in (_keys(1000, 50), _keys(5000, 1 << 40), [random.random() for _ in range(300)]):
+        work = list(data)
+        auto_sort(work)
+        assert work == sorted(data)
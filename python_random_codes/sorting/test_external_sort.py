@@ -0,0 +1,47 @@
+# test_external_sort.py
+# Запуск:  python -m pytest -q   (з теки sorting)
+import random
+
+import external_sort
+from external_sort import external_sort_lines, external_sort_records
+
+
+def _sort_file(tmp_path, data, memory):
+    src = tmp_path / "in.txt"
+    dst = tmp_path / "out.txt"
+    src.write_bytes(data)
+    external_sort_lines(str(src), str(dst), memory=memory, tmp_dir=str(tmp_path))
+    return dst.read_bytes()
+
+
+def test_lines_prefix_before_tab(tmp_path):
+    # "a" — префікс "a\tb"; з \n у ключі "a\n" > "a\tb\n" і порядок ламався
+    data = b"a\tb\na\nab\na\x01\n"
+    assert _sort_file(tmp_path, data, memory=1 << 20) == b"a\na\x01\na\tb\nab\n"
+
+
+def test_lines_prefix_many_runs(tmp_path, monkeypatch):
+    # мала пам'ять і MAX_FAN_IN=2 — багато серій і злиття в кілька проходів
+    monkeypatch.setattr(external_sort, "MAX_FAN_IN", 2)
+    rng = random.Random(7)
+    alphabet = [b"a", b"b", b"\t", b"\x00", b" "]
+    lines = [b"".join(rng.choice(alphabet) for _ in range(rng.randint(0, 4))) for _ in range(2000)]
+    out = _sort_file(tmp_path, b"\n".join(lines), memory=4096)
+    assert out == b"".join(line + b"\n" for line in sorted(lines))
+
+
+def test_records_key(tmp_path):
+    rng = random.Random(3)
+    records = [bytes(rng.randrange(4) for _ in range(4)) for _ in range(500)]
+    src = tmp_path / "in.bin"
+    dst = tmp_path / "out.bin"
+    src.write_bytes(b"".join(records))
+    external_sort_records(str(src), str(dst), 4, memory=2048, tmp_dir=str(tmp_path), key_offset=2, key_length=2)
+    out = dst.read_bytes()
+    assert [out[i:i + 4] for i in range(0, len(out), 4)] == sorted(records, key=lambda r: (r[2:4], r))
+
+
+def test_lines_empty_and_unterminated(tmp_path):
+    # останній рядок без \n і порожні рядки: \n дописується при записі, а не зберігається в рядку
+    assert _sort_file(tmp_path, b"b\n\nc\na", memory=1 << 20) == b"\na\nb\nc\n"
+    assert _sort_file(tmp_path, b"", memory=1 << 20) == b""
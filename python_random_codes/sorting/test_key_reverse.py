@@ -0,0 +1,60 @@
+# test_key_reverse.py
+# Запуск:  python -m pytest -q   (з теки sorting)
+import random
+
+import pytest
+
+from bubble_sort import bubble_sort
+from hybrid_sort import hybrid_sort
+from insertion_sort import insertion_sort
+from quick_sort import quick_sort
+from selection_sort import selection_sort
+
+ROUTINES = [bubble_sort, insertion_sort, selection_sort, quick_sort, hybrid_sort]
+
+
+class Item:
+    """Порівнюється лише за k, тож однакові k відрізняє тільки tag — видно, чи збережено порядок."""
+    __slots__ = ("k", "tag")
+
+    def __init__(self, k, tag):
+        self.k = k
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.k < other.k
+
+    def __eq__(self, other):
+        return self.k == other.k
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Item({self.k}, {self.tag})"
+
+
+def _run(fn, data, **kwargs):
+    work = list(data)
+    result = fn(work, **kwargs)
+    # quick_sort повертає новий список, решта сортують на місці
+    return [(x.k, x.tag) for x in (work if result is None else result)]
+
+
+def _data(n=200, seed=0):
+    rng = random.Random(seed)
+    return [Item(rng.randrange(8), tag) for tag in range(n)]
+
+
+@pytest.mark.parametrize("fn", ROUTINES, ids=lambda fn: fn.__name__)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_key_stable(fn, reverse):
+    data = _data()
+    expected = [(x.k, x.tag) for x in sorted(data, key=lambda x: -x.k, reverse=reverse)]
+    assert _run(fn, data, key=lambda x: -x.k, reverse=reverse) == expected
+
+
+@pytest.mark.parametrize("fn", ROUTINES, ids=lambda fn: fn.__name__)
+def test_reverse_without_key_stable(fn):
+    data = _data(seed=1)
+    expected = [(x.k, x.tag) for x in sorted(data, reverse=True)]
+    assert _run(fn, data, reverse=True) == expected
@@ -0,0 +1,32 @@
+# test_numeric_sort.py
+# Запуск:  python -m pytest -q   (з теки sorting)
+from array import array
+
+import pytest
+
+import numeric_sort
+from numeric_sort import numeric_sort as sort_buffer
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def path(request, monkeypatch):
+    if request.param == "numpy":
+        if numeric_sort.np is None:
+            pytest.skip("NumPy не встановлено")
+    else:
+        monkeypatch.setattr(numeric_sort, "np", None)
+    return request.param
+
+
+def test_memoryview_sorted_in_place(path):
+    a = array("q", [5, -1, 3, 0])
+    sort_buffer(memoryview(a))
+    assert a.tolist() == [-1, 0, 3, 5]
+
+
+def test_strided_view_rejected(path):
+    # обидва шляхи мають однаково відмовляти, а не сортувати лише без NumPy
+    a = array("d", [3.0, 1.0, 2.0, 0.0])
+    with pytest.raises(ValueError):
+        sort_buffer(memoryview(a)[::2])
+    assert a.tolist() == [3.0, 1.0, 2.0, 0.0]
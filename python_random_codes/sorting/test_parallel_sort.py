@@ -0,0 +1,35 @@
+# test_parallel_sort.py
+# Запуск:  python -m pytest -q   (з теки sorting)
+import random
+from array import array
+
+import pytest
+
+from parallel_sort import _split_for_merge, parallel_sort
+
+
+def _split(values, parts):
+    data = array("d", values)
+    bounds = [len(data) * i // parts for i in range(parts + 1)]
+    chunks = list(zip(bounds, bounds[1:]))
+    for lo, hi in chunks:
+        data[lo:hi] = array("d", sorted(data[lo:hi]))
+    return [sum(hi - lo for lo, hi in runs) for runs, _ in _split_for_merge(memoryview(data), chunks, parts)]
+
+
+@pytest.mark.parametrize("distinct", [2, 10, None])
+def test_split_is_even(distinct):
+    rnd = random.Random(0)
+    n, parts = 80_000, 8
+    values = [rnd.random() if distinct is None else float(rnd.randrange(distinct)) for _ in range(n)]
+    sizes = _split(values, parts)
+    assert sum(sizes) == n
+    # повтори ключів не повинні лишати частини порожніми
+    assert max(sizes) <= 1.1 * n / parts
+    assert min(sizes) >= 0.9 * n / parts
+
+
+def test_parallel_sort_duplicates():
+    rnd = random.Random(1)
+    data = [float(rnd.randrange(3)) for _ in range(120_000)]
+    assert list(parallel_sort(data, workers=3)) == sorted(data)
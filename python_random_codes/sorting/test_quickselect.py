@@ -0,0 +1,63 @@
+# test_quickselect.py
+# Запуск:  python -m pytest -q   (з теки sorting)
+import random
+
+import quickselect
+from quickselect import nth_element, partial_sort, top_k
+
+
+class Counted:
+    """Рахує порівняння спільним лічильником."""
+    __slots__ = ("v",)
+    count = 0
+
+    def __init__(self, v):
+        self.v = v
+
+    def __lt__(self, other):
+        Counted.count += 1
+        return self.v < other.v
+
+    def __gt__(self, other):
+        Counted.count += 1
+        return self.v > other.v
+
+
+def test_nth_element_matches_sorted():
+    rnd = random.Random(0)
+    for n in (1, 5, 17, 100, 1000):
+        for span in (3, 1000):
+            data = [rnd.randrange(span) for _ in range(n)]
+            for i in {0, n // 2, n - 1}:
+                work = list(data)
+                assert nth_element(work, i) == sorted(data)[i]
+                assert max(work[:i], default=work[i]) <= work[i] <= min(work[i + 1:], default=work[i])
+
+
+def test_partial_sort_and_top_k():
+    rnd = random.Random(1)
+    data = [rnd.randrange(100) for _ in range(500)]
+    work = list(data)
+    partial_sort(work, 20)
+    assert work[:20] == sorted(data)[:20]
+    assert top_k(data, 5) == sorted(data)[:5]
+    assert top_k(iter(data), 5, largest=True) == sorted(data, reverse=True)[:5]
+
+
+def _comparisons_with_worst_pivot(monkeypatch, n):
+    # найгірший опорний — мінімум діапазону: кожне розбиття відтинає один елемент
+    def worst(arr, lo, hi):
+        return min(range(lo, hi), key=lambda i: arr[i].v)
+
+    monkeypatch.setattr(quickselect, "_choose_pivot", worst)
+    data = [Counted(v) for v in random.Random(2).sample(range(n), n)]
+    Counted.count = 0
+    nth_element(data, n - 1)
+    assert data[n - 1].v == n - 1
+    return Counted.count
+
+
+def test_bad_pivots_stay_linear(monkeypatch):
+    # з фіксованим бюджетом у 2·log2(n) розбиттів тут виходило ~80 порівнянь на елемент і зростало з n
+    for n in (2000, 8000):
+        assert _comparisons_with_worst_pivot(monkeypatch, n) < 25 * n